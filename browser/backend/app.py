@@ -6,38 +6,198 @@ Provides coordinate mapping and data retrieval endpoints for the compressed
 genome viewer with protein structure visualization support.
 """
 
+import asyncio
+import hashlib
 import math
 import os
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional
 
+import anyio.to_thread
+import numpy as np
+import orjson
 import polars as pl
 import pyBigWig
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 
 from .config import get_config, get_data_dir, get_bigwig_dir, get_project_root
 from .models import (
     FilterInfo, Position, WindowResponse, GeneSearchResult, PositionSearchResult
 )
 from .coordinate_mapper import (
-    CoordinateMapper, sanitize_float, extract_constraint_variants,
-    extract_consequence_variants, extract_dbnsfp_stacked_variants
+    CoordinateMapper, sanitize_float, sanitize_float_array,
+    extract_consequence_variants
 )
 from .track_tree import (
-    TRACK_TREE, FILTERS, CONSTRAINT_STACKED_FIELDS, DBNSFP_STACKED_FIELDS,
+    TRACK_TREE, TRACK_TREE_JSON, FILTERS, CONSTRAINT_STACKED_FIELDS, DBNSFP_STACKED_FIELDS,
     simplify_track_name, categorize_track
 )
 
 
+# Directories are fixed for the process lifetime - resolve them once at
+# import instead of re-walking config + filesystem per request
+DATA_DIR = get_data_dir()
+BIGWIG_DIR = get_bigwig_dir()
+
 # Global data cache - uses LazyFrames for large axis tables
 axis_tables: Dict[str, pl.LazyFrame] = {}  # Lazy-loaded axis tables
+axis_core: Dict[str, pl.DataFrame] = {}  # Thin materialized (idx, chrom, pos, gene) tables
+axis_columns: Dict[str, set] = {}  # filter -> set of column names
+axis_row_counts: Dict[str, int] = {}  # filter -> total rows
 axis_paths: Dict[str, Path] = {}  # Store paths for reference
 gene_indexes: Dict[str, pl.DataFrame] = {}  # Gene indexes are small, load fully
+gene_row_index: Dict[str, Dict[str, tuple]] = {}  # filter -> {GENE: (start_row, end_row)}
+gene_lookup: Dict[str, Dict[str, List[Dict]]] = {}  # filter -> {GENE: gene index rows}
+gene_symbol_index: Dict[str, List[tuple]] = {}  # filter -> sorted [(GENE_UPPER, symbol)]
+pos_search_index: Dict[str, Dict[str, tuple]] = {}  # filter -> {chrom: (start_row, pos array)}
+bigwig_handles: Dict[str, Any] = {}  # track_id -> open pyBigWig handle
 coord_mapper = CoordinateMapper()
 
+# Maximum genomic gap (bp) bridged by a single batched BigWig range read;
+# larger gaps split the window into separate reads to avoid over-fetching
+BIGWIG_MAX_GAP = 1_000_000
+
+# Response headers for endpoints whose output is invariant for the process
+# lifetime; lets browsers and reverse proxies skip repeat requests entirely
+CACHEABLE_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+
+def get_bigwig_handle(track_id: str):
+    """Get a cached BigWig handle, opening (and caching) it on first use."""
+    handle = bigwig_handles.get(track_id)
+    if handle is None:
+        bw_path = BIGWIG_DIR / f'{track_id}.bw'
+        if not bw_path.exists():
+            return None
+        handle = pyBigWig.open(str(bw_path))
+        bigwig_handles[track_id] = handle
+    return handle
+
+
+def get_gene_df(filter_id: str, gene_upper: str) -> Optional[pl.DataFrame]:
+    """Get axis-table rows for a gene via its precomputed row span.
+
+    The span covers all rows between the gene's first and last occurrence,
+    so a cheap gene-sized filter handles overlapping genes without ever
+    scanning (or uppercasing) the full column.
+    """
+    span = gene_row_index.get(filter_id, {}).get(gene_upper)
+    if span is None:
+        return None
+    start, end = span
+    return axis_tables[filter_id].slice(start, end - start + 1).filter(
+        pl.col('gene_symbol').str.to_uppercase() == gene_upper
+    ).collect()
+
+
+# (filter_id, GENE) -> (gene_df, {(chrom, pos): row_no}), built on first use
+_gene_pos_index_cache: Dict[tuple, tuple] = {}
+
+
+def get_gene_pos_index(filter_id: str, gene_upper: str):
+    """Get (gene_df, position index) for a gene, cached after first build.
+
+    The index maps (chrom, pos) to a row number in gene_df, so protein
+    endpoints can do point lookups against column arrays instead of
+    rebuilding a dict of wide row dicts per request.
+    """
+    key = (filter_id, gene_upper)
+    cached = _gene_pos_index_cache.get(key)
+    if cached is None:
+        gene_df = get_gene_df(filter_id, gene_upper)
+        if gene_df is None:
+            return None, {}
+        pos_index = dict(zip(
+            zip(gene_df['chrom'].to_list(), gene_df['pos'].to_list()),
+            range(len(gene_df))
+        ))
+        cached = (gene_df, pos_index)
+        _gene_pos_index_cache[key] = cached
+    return cached
+
+
+# (filter_id, GENE) -> {residue: (clinvar_count, labels, max_am, filtered_indices)}
+_residue_aggregate_cache: Dict[tuple, Dict[int, tuple]] = {}
+
+
+def get_residue_aggregates(filter_id: str, gene_upper: str) -> Dict[int, tuple]:
+    """Per-residue ClinVar/AlphaMissense aggregates, built once per gene.
+
+    Axis data is immutable after startup, so the cross-position work in
+    the structure residue-data endpoint is done once per (filter, gene)
+    pair; requests after the first are one dict lookup per residue.
+    """
+    key = (filter_id, gene_upper)
+    cached = _residue_aggregate_cache.get(key)
+    if cached is not None:
+        return cached
+
+    gene_df, pos_index = get_gene_pos_index(filter_id, gene_upper)
+
+    def get_float_array(name):
+        if gene_df is not None and name in gene_df.columns:
+            return gene_df[name].cast(pl.Float64).to_numpy()
+        return None
+
+    if gene_df is not None and 'clinvar.clinvar_label_list' in gene_df.columns:
+        clinvar_labels_col = gene_df['clinvar.clinvar_label_list'].to_list()
+    else:
+        clinvar_labels_col = None
+    filtered_idx_arr = get_float_array('filtered_idx')
+    clinvar_count_arr = get_float_array('clinvar.clinvar_count')
+    am_arr = get_float_array('dbnsfp.max_AlphaMissense_am_pathogenicity')
+
+    all_residues = coord_mapper.get_residue_numbers(gene_upper)
+    positions_by_residue = coord_mapper.protein_to_genomic_many(gene_upper, all_residues)
+
+    aggregates: Dict[int, tuple] = {}
+    for residue, positions in positions_by_residue.items():
+        clinvar_count = 0
+        clinvar_labels = set()
+        max_alphamissense = None
+        filtered_indices = []
+
+        matched_rows = [
+            row_no for pos in positions
+            if (row_no := pos_index.get((pos['chrom'], pos['pos']))) is not None
+        ]
+
+        if clinvar_labels_col:
+            for row_no in matched_rows:
+                labels = clinvar_labels_col[row_no]
+                if labels:
+                    if isinstance(labels, list):
+                        clinvar_labels.update(labels)
+                    else:
+                        clinvar_labels.add(labels)
+
+        if matched_rows:
+            if clinvar_count_arr is not None:
+                clinvar_count = int(np.nansum(clinvar_count_arr[matched_rows]))
+            if filtered_idx_arr is not None:
+                matched_idx = filtered_idx_arr[matched_rows]
+                matched_idx = matched_idx[np.isfinite(matched_idx)]
+                filtered_indices = matched_idx.astype(np.int64).tolist()
+            if am_arr is not None:
+                finite = am_arr[matched_rows]
+                finite = finite[np.isfinite(finite)]
+                if finite.size:
+                    max_alphamissense = float(finite.max())
+
+        aggregates[residue] = (
+            clinvar_count, list(clinvar_labels), max_alphamissense, filtered_indices
+        )
+
+    _residue_aggregate_cache[key] = aggregates
+    return aggregates
+
 # Legacy - kept for compatibility
 CHROMOSOME = 'all'
 
@@ -45,7 +205,8 @@ CHROMOSOME = 'all'
 app = FastAPI(
     title="VarPredBrowser API",
     description="API for exploring genomic data in compressed coordinate space with protein structure visualization",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Enable CORS for frontend development
@@ -62,51 +223,195 @@ app.add_middleware(
 # Startup: Load data into memory
 # =============================================================================
 
+def _setup_filter(filter_id: str, data_dir: Path) -> Optional[Dict[str, Any]]:
+    """Load one filter's axis table, core projection and gene indexes.
+
+    Runs in a worker thread during startup; returns the pieces to install
+    into the module-level caches (or None if the axis table is missing).
+    """
+    # Try all-chromosomes file first, then fall back to chr1-specific
+    axis_file = data_dir / f'{filter_id}.parquet'
+    if not axis_file.exists():
+        axis_file = data_dir / f'{filter_id}_chr1.parquet'
+
+    if not axis_file.exists():
+        print(f"Warning: Axis table not found for {filter_id}")
+        return None
+
+    # Use lazy scanning instead of full load
+    print(f"Registering {axis_file.name} (lazy)...")
+    lazy = pl.scan_parquet(axis_file)
+    # Cache schema and row count so request handlers never re-scan for them
+    column_names = lazy.collect_schema().names()
+    columns = set(column_names)
+    row_count = lazy.select(pl.len()).collect().item()
+    print(f"  Registered {filter_id}: {row_count:,} positions, {len(column_names)} columns")
+
+    # Thin materialized projection for window/gene/axis endpoints - wide
+    # annotation columns stay lazy and are only read when requested.
+    # Prefer the narrow companion parquet written by preprocessing; fall
+    # back to a projected scan of the wide table
+    core_cols = [c for c in ('filtered_idx', 'chrom', 'pos', 'gene_symbol')
+                 if c in columns]
+    core_file = data_dir / f'{filter_id}_core.parquet'
+    if core_file.exists():
+        core = pl.read_parquet(core_file, columns=core_cols)
+    else:
+        # Streaming keeps the projected scan from spiking memory while the
+        # wide parquet is decoded
+        core = lazy.select(core_cols).collect(engine='streaming')
+
+    # Window endpoints slice by row position, which assumes filtered_idx
+    # is a dense 0..N-1 row index (guaranteed by preprocessing)
+    is_dense = core.select(
+        (pl.col('filtered_idx') == pl.int_range(pl.len())).all()
+    ).item()
+    if not is_dense:
+        print(f"  Warning: filtered_idx is not a dense row index for {filter_id}; "
+              f"window queries may return wrong rows")
+
+    # Build gene -> row-span index so gene-scoped queries avoid
+    # uppercasing/scanning the full gene_symbol column per request
+    spans = core.select(
+        pl.col('gene_symbol').str.to_uppercase().alias('gene_symbol'),
+        pl.int_range(pl.len()).alias('_row')
+    ).group_by('gene_symbol').agg(
+        pl.col('_row').min().alias('start'),
+        pl.col('_row').max().alias('end'),
+    ).drop_nulls('gene_symbol')
+    row_index = dict(zip(
+        spans['gene_symbol'].to_list(),
+        zip(spans['start'].to_list(), spans['end'].to_list()),
+    ))
+    print(f"  Gene row index: {len(row_index):,} genes")
+
+    # Per-chromosome sorted position arrays for O(log N) position search;
+    # chromosomes form contiguous runs in genomic order
+    chrom_runs = core.select(
+        'chrom', pl.int_range(pl.len()).alias('_row')
+    ).group_by('chrom').agg(
+        pl.col('_row').min().alias('start'),
+        pl.col('_row').max().alias('end'),
+    )
+    chrom_index = {}
+    for chrom, run_start, run_end in chrom_runs.iter_rows():
+        pos_arr = core['pos'].slice(run_start, run_end - run_start + 1).to_numpy()
+        if np.all(np.diff(pos_arr) >= 0):
+            chrom_index[chrom] = (run_start, pos_arr)
+        else:
+            print(f"  Warning: positions not sorted for {chrom} in {filter_id}; "
+                  f"position search falls back to a scan")
+
+    result = {
+        'lazy': lazy,
+        'path': axis_file,
+        'columns': columns,
+        'row_count': row_count,
+        'core': core,
+        'row_index': row_index,
+        'chrom_index': chrom_index,
+        'gene_index': None,
+        'lookup': None,
+        'symbol_index': None,
+    }
+
+    # Load gene index
+    gene_file = data_dir / f'gene_index_{filter_id}.parquet'
+    if not gene_file.exists():
+        gene_file = data_dir / f'gene_index_{filter_id}_chr1.parquet'
+
+    if gene_file.exists():
+        gene_index = pl.read_parquet(gene_file)
+        print(f"  Gene index: {len(gene_index):,} genes")
+
+        # Uppercase-keyed lookup for exact search plus a sorted symbol
+        # list for bisect-based autocomplete
+        lookup: Dict[str, List[Dict]] = {}
+        for row in gene_index.iter_rows(named=True):
+            symbol = row.get('gene_symbol')
+            if symbol:
+                lookup.setdefault(symbol.upper(), []).append(row)
+        result['gene_index'] = gene_index
+        result['lookup'] = lookup
+        result['symbol_index'] = sorted(
+            (upper, rows[0]['gene_symbol'])
+            for upper, rows in lookup.items()
+        )
+
+    return result
+
+
+def _load_all_data(data_dir: Path) -> None:
+    """Load all filters and protein maps, parallelizing the parquet I/O.
+
+    Polars/Arrow release the GIL during parquet decode, so a thread pool
+    brings cold-start close to the cost of the slowest single file.
+    """
+    # Start from fresh mutable dicts; load_data freezes them to read-only
+    # views once loading finishes, so a restart must rebind first
+    global axis_tables, axis_core, axis_columns, axis_row_counts, axis_paths
+    global gene_indexes, gene_row_index, gene_lookup, gene_symbol_index, pos_search_index
+    axis_tables = {}
+    axis_core = {}
+    axis_columns = {}
+    axis_row_counts = {}
+    axis_paths = {}
+    gene_indexes = {}
+    gene_row_index = {}
+    gene_lookup = {}
+    gene_symbol_index = {}
+    pos_search_index = {}
+    _gene_pos_index_cache.clear()
+    _residue_aggregate_cache.clear()
+
+    max_workers = min(8, max(1, len(FILTERS)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_setup_filter, filter_id, data_dir): filter_id
+            for filter_id in FILTERS.keys()
+        }
+        for future in as_completed(futures):
+            filter_id = futures[future]
+            result = future.result()
+            if result is None:
+                continue
+            axis_tables[filter_id] = result['lazy']
+            axis_paths[filter_id] = result['path']
+            axis_columns[filter_id] = result['columns']
+            axis_row_counts[filter_id] = result['row_count']
+            axis_core[filter_id] = result['core']
+            gene_row_index[filter_id] = result['row_index']
+            pos_search_index[filter_id] = result['chrom_index']
+            if result['gene_index'] is not None:
+                gene_indexes[filter_id] = result['gene_index']
+                gene_lookup[filter_id] = result['lookup']
+                gene_symbol_index[filter_id] = result['symbol_index']
+
+    # Register protein coordinate map paths; each map is read and indexed
+    # on the first request that touches its gene, so startup cost does not
+    # scale with the number of configured genes
+    print("\nDiscovering protein coordinate maps...")
+    protein_map_files = list(data_dir.glob('*_protein_map.parquet'))
+    for map_file in protein_map_files:
+        gene_name = map_file.stem.replace('_protein_map', '').upper()
+        coord_mapper.register_map_path(gene_name, map_file)
+        print(f"  Registered protein map for {gene_name}")
+
+
 @app.on_event("startup")
 async def load_data():
     """Setup lazy axis table references and load small indexes into memory on startup."""
-    global axis_tables, axis_paths, gene_indexes, coord_mapper
-
     config = get_config()
-    data_dir = get_data_dir()
+    data_dir = DATA_DIR
 
     print(f"Setting up data from {data_dir}...")
 
-    for filter_id in FILTERS.keys():
-        # Try all-chromosomes file first, then fall back to chr1-specific
-        axis_file = data_dir / f'{filter_id}.parquet'
-        if not axis_file.exists():
-            axis_file = data_dir / f'{filter_id}_chr1.parquet'
-
-        if not axis_file.exists():
-            print(f"Warning: Axis table not found for {filter_id}")
-            continue
-
-        # Use lazy scanning instead of full load
-        print(f"Registering {axis_file.name} (lazy)...")
-        axis_tables[filter_id] = pl.scan_parquet(axis_file)
-        axis_paths[filter_id] = axis_file
-        # Get row count without loading data
-        row_count = axis_tables[filter_id].select(pl.len()).collect().item()
-        col_count = len(axis_tables[filter_id].collect_schema().names())
-        print(f"  Registered {filter_id}: {row_count:,} positions, {col_count} columns")
-
-        # Load gene index
-        gene_file = data_dir / f'gene_index_{filter_id}.parquet'
-        if not gene_file.exists():
-            gene_file = data_dir / f'gene_index_{filter_id}_chr1.parquet'
-
-        if gene_file.exists():
-            gene_indexes[filter_id] = pl.read_parquet(gene_file)
-            print(f"  Gene index: {len(gene_indexes[filter_id]):,} genes")
-
-    # Load protein coordinate maps
-    print("\nLoading protein coordinate maps...")
-    protein_map_files = list(data_dir.glob('*_protein_map.parquet'))
-    for map_file in protein_map_files:
-        gene_name = map_file.stem.replace('_protein_map', '').upper()
-        if coord_mapper.load_protein_map(gene_name, map_file):
-            print(f"  Loaded protein map for {gene_name}")
+    # Hot endpoints run their CPU work via anyio.to_thread; widen the default
+    # thread pool so one slow request doesn't queue behind others
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+
+    # Run the blocking parquet I/O off the event loop
+    await asyncio.to_thread(_load_all_data, data_dir)
 
     # Load structure metadata
     structure_metadata_file = data_dir / 'structure_metadata.json'
@@ -114,7 +419,46 @@ async def load_data():
         if coord_mapper.load_structure_metadata(structure_metadata_file):
             print(f"  Loaded structure metadata")
 
-    print(f"\nReady! Registered {len(axis_tables)} filter(s) (lazy), {len(coord_mapper.protein_maps)} protein map(s)")
+    # Open BigWig handles once - per-request pyBigWig.open re-parses headers
+    bigwig_dir = BIGWIG_DIR
+    if bigwig_dir.exists():
+        for bw_file in sorted(bigwig_dir.glob('*.bw')):
+            try:
+                bigwig_handles[bw_file.stem] = pyBigWig.open(str(bw_file))
+            except Exception as e:
+                print(f"Warning: Could not open BigWig {bw_file.name}: {e}")
+        if bigwig_handles:
+            print(f"  Opened {len(bigwig_handles)} BigWig handle(s)")
+
+    # Freeze the per-filter lookup state by rebinding the module mappings
+    # to read-only views, so request handlers cannot mutate shared data
+    # across the worker threads. bigwig_handles stays a plain dict because
+    # get_bigwig_handle lazily opens missing tracks.
+    global axis_tables, axis_core, axis_columns, axis_row_counts, axis_paths
+    global gene_indexes, gene_row_index, gene_lookup, gene_symbol_index, pos_search_index
+    axis_tables = MappingProxyType(dict(axis_tables))
+    axis_core = MappingProxyType(dict(axis_core))
+    axis_columns = MappingProxyType(dict(axis_columns))
+    axis_row_counts = MappingProxyType(dict(axis_row_counts))
+    axis_paths = MappingProxyType(dict(axis_paths))
+    gene_indexes = MappingProxyType(dict(gene_indexes))
+    gene_row_index = MappingProxyType(dict(gene_row_index))
+    gene_lookup = MappingProxyType(dict(gene_lookup))
+    gene_symbol_index = MappingProxyType(dict(gene_symbol_index))
+    pos_search_index = MappingProxyType(dict(pos_search_index))
+
+    print(f"\nReady! Registered {len(axis_tables)} filter(s) (lazy), {len(coord_mapper.known_genes)} protein map(s)")
+
+
+@app.on_event("shutdown")
+async def close_handles():
+    """Close cached BigWig handles on shutdown."""
+    for handle in bigwig_handles.values():
+        try:
+            handle.close()
+        except Exception:
+            pass
+    bigwig_handles.clear()
 
 
 # =============================================================================
@@ -140,8 +484,7 @@ async def get_filters():
 
     result = []
     for filter_id in axis_tables.keys():
-        # Get row count from lazy frame
-        total = axis_tables[filter_id].select(pl.len()).collect().item()
+        total = axis_row_counts[filter_id]
         result.append(FilterInfo(
             id=filter_id,
             name=f"{FILTERS[filter_id]['name']} (all chromosomes)",
@@ -154,15 +497,26 @@ async def get_filters():
 
 @app.get("/api/track-tree")
 async def get_track_tree():
-    """Get hierarchical track tree for frontend."""
-    return TRACK_TREE
+    """Get hierarchical track tree for frontend.
+
+    Served from bytes pre-serialized at import; no per-request encoding.
+    """
+    return Response(content=TRACK_TREE_JSON, media_type="application/json")
+
+
+# /api/tracks output is invariant after startup; built once, served from here
+_tracks_response: Optional[Dict[str, Any]] = None
 
 
 @app.get("/api/tracks")
 async def get_tracks():
     """Get all available tracks from BigWig files and axis table columns."""
+    global _tracks_response
+    if _tracks_response is not None:
+        return _tracks_response
+
     tracks = []
-    bigwig_dir = get_bigwig_dir()
+    bigwig_dir = BIGWIG_DIR
 
     # Get tracks from BigWig directory
     if bigwig_dir.exists():
@@ -178,8 +532,8 @@ async def get_tracks():
     # Also add columns from axis tables
     if axis_tables:
         all_columns = set()
-        for axis_table in axis_tables.values():
-            all_columns.update(axis_table.columns)
+        for cols in axis_columns.values():
+            all_columns.update(cols)
 
         for col in all_columns:
             if col not in ['filtered_idx', 'chrom', 'pos', 'gene_symbol']:
@@ -191,155 +545,241 @@ async def get_tracks():
                         "category": categorize_track(col)
                     })
 
-    return {"tracks": tracks, "total": len(tracks)}
+    _tracks_response = {"tracks": tracks, "total": len(tracks)}
+    return _tracks_response
 
 
 # =============================================================================
 # Genomic Data Endpoints
 # =============================================================================
 
-@app.get("/api/filtered-window", response_model=WindowResponse)
-async def get_filtered_window(
-    filter_id: str = Query(..., description="Filter ID"),
-    start: int = Query(..., ge=0, description="Start position in filtered coordinates"),
-    end: int = Query(..., description="End position in filtered coordinates"),
-):
-    """Get positions in a window of compressed coordinates."""
-    if filter_id not in axis_tables:
-        raise HTTPException(status_code=400, detail=f"Unknown filter: {filter_id}")
-
+def _compute_filtered_window(filter_id: str, start: int, end: int) -> Dict[str, Any]:
+    """Build the filtered-window payload (runs in a worker thread)."""
     axis_table = axis_tables[filter_id]
 
-    # Clamp to valid range (get total rows from lazy frame)
-    total_rows = axis_table.select(pl.len()).collect().item()
-    max_idx = total_rows - 1
+    # Clamp to valid range (row count cached at startup)
+    max_idx = axis_row_counts[filter_id] - 1
     start = max(0, min(start, max_idx))
     end = max(start, min(end, max_idx))
 
-    # Get window (filter and collect)
-    window_df = axis_table.filter(
-        (pl.col('filtered_idx') >= start) &
-        (pl.col('filtered_idx') <= end)
-    ).collect()
+    # Get window - filtered_idx equals row position, so this is an O(window) slice
+    window_df = axis_table.slice(start, end - start + 1).collect()
 
-    positions = window_df.to_dicts()
+    # Extract columns via Arrow (zero-copy) instead of materializing a dict
+    # per row - the response is column-major: {column: [values]}
+    tbl = window_df.to_arrow()
+    positions = {name: tbl.column(name).to_pylist() for name in tbl.column_names}
 
-    # Compute real coordinate ranges
+    # Compute real coordinate ranges (min/max in a single pass)
     real_ranges = []
     if len(window_df) > 0:
+        pos_range = window_df.select([
+            pl.col('pos').min().alias('min'),
+            pl.col('pos').max().alias('max'),
+        ]).row(0)
         real_ranges.append({
             "chrom": CHROMOSOME,
-            "start": int(window_df['pos'].min()),
-            "end": int(window_df['pos'].max())
+            "start": int(pos_range[0]),
+            "end": int(pos_range[1])
         })
 
-    return WindowResponse(
-        filter_id=filter_id,
-        window={
+    return {
+        "filter_id": filter_id,
+        "window": {
             "filtered_start": start,
             "filtered_end": end,
             "num_positions": len(window_df)
         },
-        positions=positions,
-        real_coordinate_ranges=real_ranges
-    )
+        "positions": positions,
+        "real_coordinate_ranges": real_ranges
+    }
 
 
-@app.get("/api/track-data")
-async def get_track_data(
-    track_id: str = Query(..., description="Track/column name"),
+@app.get("/api/filtered-window")
+async def get_filtered_window(
     filter_id: str = Query(..., description="Filter ID"),
-    filtered_start: int = Query(..., ge=0),
-    filtered_end: int = Query(...),
+    start: int = Query(..., ge=0, description="Start position in filtered coordinates"),
+    end: int = Query(..., description="End position in filtered coordinates"),
 ):
-    """Get track values for a compressed coordinate window."""
+    """Get positions in a window of compressed coordinates."""
     if filter_id not in axis_tables:
         raise HTTPException(status_code=400, detail=f"Unknown filter: {filter_id}")
 
-    axis_table = axis_tables[filter_id]
-    bigwig_dir = get_bigwig_dir()
-
-    # Get window positions (filter and collect from lazy frame)
-    window_df = axis_table.filter(
-        (pl.col('filtered_idx') >= filtered_start) &
-        (pl.col('filtered_idx') <= filtered_end)
-    ).collect()
-
-    # Check if track_id is in axis_table
-    if track_id in window_df.columns:
-        # For constraint columns, return full variant data
+    # Run the Polars/serialization work off the event loop
+    payload = await anyio.to_thread.run_sync(_compute_filtered_window, filter_id, start, end)
+    return ORJSONResponse(payload)
+
+
+def _compute_track_data(
+    track_id: str, filter_id: str, filtered_start: int, filtered_end: int
+) -> Dict[str, Any]:
+    """Build the track-data payload (runs in a worker thread)."""
+    # Clamp like the sibling window paths: an inverted range yields an
+    # empty slice rather than a negative length, which LazyFrame rejects
+    window_len = max(0, filtered_end - filtered_start + 1)
+
+    # Check if track_id is in the axis table (schema cached at startup)
+    if track_id in axis_columns[filter_id]:
+        # Projection pushdown: only filtered_idx and the track column are read
+        window_df = axis_tables[filter_id].select(
+            ['filtered_idx', track_id]
+        ).slice(filtered_start, window_len).collect()
+        # For constraint columns, return full variant data via a native
+        # explode/unnest pipeline - data stays in Arrow until the final dicts
         if track_id in ['Constraint', 'Core', 'Complete']:
-            values = []
-            for row in window_df.select(['filtered_idx', track_id]).to_dicts():
-                variant_data = extract_constraint_variants(row[track_id])
-                values.append({
-                    "filtered_idx": row["filtered_idx"],
-                    "variants": [
-                        {"allele": allele, "pred": sanitize_float(pred)}
-                        for allele, pred in variant_data
-                    ]
-                })
+            exploded = (
+                window_df.lazy()
+                .select(['filtered_idx', track_id])
+                .explode(track_id)
+                .unnest(track_id)
+                .rename({'_0': 'allele', '_1': 'pred'})
+                .with_columns(
+                    pl.when(pl.col('pred').is_nan() | pl.col('pred').is_infinite())
+                    .then(None)
+                    .otherwise(pl.col('pred'))
+                    .alias('pred')
+                )
+                .filter(pl.col('allele').is_not_null() & pl.col('pred').is_not_null())
+                # Lowest to highest pred for bottom-to-top stacking
+                .sort(['filtered_idx', 'pred'])
+                .group_by('filtered_idx', maintain_order=True)
+                .agg(pl.struct(['allele', 'pred']).alias('variants'))
+                .collect()
+            )
+            # Left-join so positions without variants keep an empty list
+            result = window_df.select('filtered_idx').join(
+                exploded, on='filtered_idx', how='left'
+            )
+            values = [
+                {"filtered_idx": idx, "variants": variants or []}
+                for idx, variants in zip(
+                    result['filtered_idx'].to_list(), result['variants'].to_list()
+                )
+            ]
             return {"track_id": track_id, "values": values}
-        # For dbNSFP stacked columns, return full variant data with score and percentile
+        # For dbNSFP stacked columns, return full variant data with score
+        # and percentile via the same explode/unnest pipeline as Constraint
         elif track_id in DBNSFP_STACKED_FIELDS:
-            values = []
-            for row in window_df.select(['filtered_idx', track_id]).to_dicts():
-                variant_data = extract_dbnsfp_stacked_variants(row[track_id])
-                values.append({
-                    "filtered_idx": row["filtered_idx"],
-                    "variants": [
-                        {"allele": allele, "score": sanitize_float(score), "percentile": sanitize_float(pct)}
-                        for allele, score, pct in variant_data
-                    ]
-                })
+            exploded = (
+                window_df.lazy()
+                .select(['filtered_idx', track_id])
+                .explode(track_id)
+                .unnest(track_id)
+                .rename({'_0': 'allele', '_1': 'score', '_2': 'percentile'})
+                .with_columns(
+                    pl.when(pl.col('score').is_nan() | pl.col('score').is_infinite())
+                    .then(None)
+                    .otherwise(pl.col('score'))
+                    .alias('score'),
+                    pl.when(pl.col('percentile').is_nan() | pl.col('percentile').is_infinite())
+                    .then(None)
+                    .otherwise(pl.col('percentile'))
+                    .alias('percentile'),
+                )
+                .filter(pl.col('allele').is_not_null() & pl.col('score').is_not_null())
+                # Lowest to highest score for bottom-to-top stacking
+                .sort(['filtered_idx', 'score'])
+                .group_by('filtered_idx', maintain_order=True)
+                .agg(pl.struct(['allele', 'score', 'percentile']).alias('variants'))
+                .collect()
+            )
+            # Left-join so positions without variants keep an empty list
+            result = window_df.select('filtered_idx').join(
+                exploded, on='filtered_idx', how='left'
+            )
+            values = [
+                {"filtered_idx": idx, "variants": variants or []}
+                for idx, variants in zip(
+                    result['filtered_idx'].to_list(), result['variants'].to_list()
+                )
+            ]
             return {"track_id": track_id, "values": values}
         # For variant_consequences column, return allele -> consequence map
         elif track_id == 'variant_consequences':
-            values = []
-            for row in window_df.select(['filtered_idx', track_id]).to_dicts():
-                consequence_map = extract_consequence_variants(row[track_id])
-                values.append({
-                    "filtered_idx": row["filtered_idx"],
-                    "consequences": consequence_map  # Dict: allele -> category
-                })
+            values = [
+                {
+                    "filtered_idx": idx,
+                    "consequences": extract_consequence_variants(raw)  # Dict: allele -> category
+                }
+                for idx, raw in zip(
+                    window_df['filtered_idx'].to_list(), window_df[track_id].to_list()
+                )
+            ]
             return {"track_id": track_id, "values": values}
         else:
+            # One vectorized NaN/Inf pass instead of sanitize_float per cell
+            sanitized = sanitize_float_array(window_df[track_id])
             values = [
-                {"filtered_idx": row["filtered_idx"], "value": sanitize_float(row[track_id])}
-                for row in window_df.select(['filtered_idx', track_id]).to_dicts()
+                {"filtered_idx": idx, "value": value}
+                for idx, value in zip(window_df['filtered_idx'].to_list(), sanitized)
             ]
             return {"track_id": track_id, "values": values}
 
-    # Try to load from BigWig
-    bw_path = bigwig_dir / f'{track_id}.bw'
-    if not bw_path.exists():
+    # Try to load from BigWig (cached handle, batched range reads)
+    bw = get_bigwig_handle(track_id)
+    if bw is None:
         raise HTTPException(status_code=404, detail=f"Track not found: {track_id}")
 
+    window_df = axis_core[filter_id].slice(filtered_start, window_len)
+
     try:
-        bw = pyBigWig.open(str(bw_path))
-        values = []
-        for row in window_df.iter_rows(named=True):
-            chrom = row['chrom']
-            pos = row['pos']
-            filtered_idx = row['filtered_idx']
+        chroms = window_df['chrom'].to_numpy()
+        positions = window_df['pos'].to_numpy()
+        filtered_idx = window_df['filtered_idx'].to_numpy()
+        out = np.zeros(len(positions), dtype=np.float64)
+
+        # Window rows follow genomic order, so chromosomes form contiguous
+        # runs; fetch each run with one bw.values() call, splitting runs at
+        # large genomic gaps to avoid over-fetching
+        run_start = 0
+        for i in range(1, len(chroms) + 1):
+            if i < len(chroms) and chroms[i] == chroms[run_start]:
+                continue
 
-            try:
-                val = bw.values(chrom, pos, pos + 1)[0]
-                sanitized_val = sanitize_float(val)
-                values.append({
-                    "filtered_idx": filtered_idx,
-                    "value": sanitized_val if sanitized_val is not None else 0.0
-                })
-            except:
-                values.append({"filtered_idx": filtered_idx, "value": 0.0})
-
-        bw.close()
+            chrom = chroms[run_start]
+            run_pos = positions[run_start:i]
+            gap_splits = np.flatnonzero(np.diff(run_pos) > BIGWIG_MAX_GAP) + 1
+            for seg in np.split(np.arange(len(run_pos)), gap_splits):
+                lo = int(run_pos[seg[0]])
+                hi = int(run_pos[seg[-1]])
+                try:
+                    arr = bw.values(chrom, lo, hi + 1, numpy=True)
+                    out[run_start + seg] = arr[run_pos[seg] - lo]
+                except RuntimeError:
+                    # Chromosome not in file or range out of bounds
+                    pass
+
+            run_start = i
+
+        np.nan_to_num(out, copy=False)
+        values = [
+            {"filtered_idx": idx, "value": val}
+            for idx, val in zip(filtered_idx.tolist(), out.tolist())
+        ]
         return {"track_id": track_id, "values": values}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading BigWig: {str(e)}")
 
 
+@app.get("/api/track-data")
+async def get_track_data(
+    track_id: str = Query(..., description="Track/column name"),
+    filter_id: str = Query(..., description="Filter ID"),
+    filtered_start: int = Query(..., ge=0),
+    filtered_end: int = Query(...),
+):
+    """Get track values for a compressed coordinate window."""
+    if filter_id not in axis_tables:
+        raise HTTPException(status_code=400, detail=f"Unknown filter: {filter_id}")
+
+    # Run the Polars/BigWig work off the event loop
+    payload = await anyio.to_thread.run_sync(
+        _compute_track_data, track_id, filter_id, filtered_start, filtered_end
+    )
+    return ORJSONResponse(payload)
+
+
 @app.get("/api/genes-in-window")
 async def genes_in_window(
     filter_id: str = Query(..., description="Filter ID"),
@@ -350,22 +790,15 @@ async def genes_in_window(
     if filter_id not in axis_tables:
         raise HTTPException(status_code=400, detail=f"Unknown filter: {filter_id}")
 
-    axis_table = axis_tables[filter_id]
-
-    # Filter and collect from lazy frame
-    window = axis_table.filter(
-        (pl.col('filtered_idx') >= start) &
-        (pl.col('filtered_idx') <= end)
-    ).collect()
+    # filtered_idx equals row position, so slice the thin core table directly
+    start = max(0, start)
+    window = axis_core[filter_id].slice(start, max(0, end - start + 1))
 
     if len(window) == 0:
         return {"genes": [], "count": 0}
 
-    genes = window.select('gene_symbol').unique().filter(
-        pl.col('gene_symbol').is_not_null()
-    ).sort('gene_symbol')
-
-    gene_list = [row['gene_symbol'] for row in genes.to_dicts()]
+    # Series pipeline - no per-row dict materialization
+    gene_list = window.get_column('gene_symbol').drop_nulls().unique().sort().to_list()
     return {"genes": gene_list, "count": len(gene_list)}
 
 
@@ -380,24 +813,28 @@ async def get_axis_labels(
     if filter_id not in axis_tables:
         raise HTTPException(status_code=400, detail=f"Unknown filter: {filter_id}")
 
-    axis_table = axis_tables[filter_id]
-
     window_size = filtered_end - filtered_start
     step = max(1, window_size // density)
 
-    labels = []
-    for filtered_idx in range(filtered_start, filtered_end, step):
-        # Collect result from lazy frame
-        result = axis_table.filter(pl.col('filtered_idx') == filtered_idx).collect()
-        if len(result) > 0:
-            row = result.to_dicts()[0]
-            labels.append({
-                "filtered_idx": filtered_idx,
-                "chrom": row['chrom'],
-                "pos": row['pos'],
-                "label": f"{row['chrom']}:{row['pos']:,}",
-                "type": "position"
-            })
+    # Single slice + stride gather on the thin core table
+    label_rows = axis_core[filter_id].slice(
+        filtered_start, max(0, window_size)
+    ).gather_every(step)
+
+    labels = [
+        {
+            "filtered_idx": idx,
+            "chrom": c,
+            "pos": p,
+            "label": f"{c}:{p:,}",
+            "type": "position"
+        }
+        for idx, c, p in zip(
+            label_rows['filtered_idx'].to_list(),
+            label_rows['chrom'].to_list(),
+            label_rows['pos'].to_list(),
+        )
+    ]
 
     return {"labels": labels}
 
@@ -412,19 +849,11 @@ async def search_gene(
     filter_id: str = Query(..., description="Filter ID"),
 ):
     """Search for a gene and get its compressed coordinates."""
-    if filter_id not in gene_indexes:
+    if filter_id not in gene_lookup:
         raise HTTPException(status_code=400, detail=f"Gene index not available for filter: {filter_id}")
 
-    gene_index = gene_indexes[filter_id]
-
-    results = gene_index.filter(
-        pl.col('gene_symbol').str.to_uppercase() == gene.upper()
-    )
-
-    if len(results) == 0:
-        return []
-
-    return [GeneSearchResult(**row) for row in results.to_dicts()]
+    rows = gene_lookup[filter_id].get(gene.upper(), [])
+    return [GeneSearchResult(**row) for row in rows]
 
 
 @app.get("/api/search/gene/autocomplete")
@@ -434,17 +863,21 @@ async def autocomplete_gene(
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
 ):
     """Autocomplete gene symbols with prefix matching."""
-    if filter_id not in gene_indexes:
+    if filter_id not in gene_symbol_index:
         raise HTTPException(status_code=400, detail=f"Gene index not available for filter: {filter_id}")
 
-    gene_index = gene_indexes[filter_id]
+    symbols = gene_symbol_index[filter_id]
 
+    # Binary search for the first symbol with the query prefix, then walk
     query_upper = query.upper()
-    results = gene_index.filter(
-        pl.col('gene_symbol').str.to_uppercase().str.starts_with(query_upper)
-    ).head(limit)
+    start = bisect_left(symbols, (query_upper,))
+    matches = []
+    for upper, symbol in symbols[start:start + limit]:
+        if not upper.startswith(query_upper):
+            break
+        matches.append(symbol)
 
-    return [row['gene_symbol'] for row in results.to_dicts()]
+    return matches
 
 
 @app.get("/api/search/position", response_model=PositionSearchResult)
@@ -457,22 +890,30 @@ async def search_position(
     if filter_id not in axis_tables:
         raise HTTPException(status_code=400, detail=f"Unknown filter: {filter_id}")
 
-    axis_table = axis_tables[filter_id]
-
-    # Filter and collect from lazy frame
-    result = axis_table.filter(
-        (pl.col('chrom') == chrom) &
-        (pl.col('pos') == pos)
-    ).collect()
+    # Binary search on the per-chromosome sorted position array
+    row = None
+    entry = pos_search_index.get(filter_id, {}).get(chrom)
+    if entry is not None:
+        start_row, pos_arr = entry
+        i = int(np.searchsorted(pos_arr, pos))
+        if i < len(pos_arr) and pos_arr[i] == pos:
+            row = axis_core[filter_id].row(start_row + i, named=True)
+    else:
+        # Fall back to a scan if the chromosome had unsorted positions
+        result = axis_core[filter_id].filter(
+            (pl.col('chrom') == chrom) &
+            (pl.col('pos') == pos)
+        )
+        if len(result) > 0:
+            row = result.row(0, named=True)
 
-    if len(result) == 0:
+    if row is None:
         return PositionSearchResult(
             query={"chrom": chrom, "pos": pos},
             filter_id=filter_id,
             result=None
         )
 
-    row = result.to_dicts()[0]
     return PositionSearchResult(
         query={"chrom": chrom, "pos": pos},
         filter_id=filter_id,
@@ -504,12 +945,15 @@ async def gene_aa_lookup(
             detail="AA position data not available in this dataset"
         )
 
-    # Filter and collect from lazy frame
-    results = axis_table.filter(
-        (pl.col('gene_symbol').str.to_uppercase() == gene.upper()) &
-        (pl.col('aa_pos') >= aa_start) &
-        (pl.col('aa_pos') <= aa_end)
-    ).sort('aa_pos').collect()
+    # Gene-sized slice via the precomputed row-span index
+    gene_df = get_gene_df(filter_id, gene.upper())
+    results = (
+        gene_df.filter(
+            (pl.col('aa_pos') >= aa_start) &
+            (pl.col('aa_pos') <= aa_end)
+        ).sort('aa_pos')
+        if gene_df is not None else pl.DataFrame()
+    )
 
     if len(results) == 0:
         raise HTTPException(
@@ -578,23 +1022,17 @@ async def get_protein(
     return response
 
 
-@app.get("/api/protein/{gene}/residues")
-async def get_protein_residues(
-    gene: str,
-    start: int = Query(1, ge=1, description="Start residue (1-based)"),
-    end: int = Query(None, description="End residue (defaults to protein length)"),
-    filter_id: str = Query("missense_only", description="Filter ID for constraint data"),
-    include_plddt: bool = Query(True, description="Include pLDDT scores"),
-    include_constraints: bool = Query(True, description="Include constraint metrics"),
-):
-    """Get per-residue data for a protein region."""
-    gene_upper = gene.upper()
+@lru_cache(maxsize=128)
+def _compute_protein_residues(
+    gene: str, start: int, end: Optional[int], filter_id: str,
+    include_plddt: bool, include_constraints: bool
+) -> Dict[str, Any]:
+    """Build the per-residue payload (runs in a worker thread).
 
-    if not coord_mapper.has_gene(gene_upper):
-        raise HTTPException(
-            status_code=404,
-            detail=f"Gene {gene} not found. Currently only SCN2A is supported."
-        )
+    Memoized per query since the underlying data is immutable after
+    startup; treat the returned payload as read-only.
+    """
+    gene_upper = gene.upper()
 
     metadata = coord_mapper.get_structure_metadata(gene_upper)
     protein_length = metadata.get('protein_length', 2005) if metadata else 2005
@@ -605,39 +1043,81 @@ async def get_protein_residues(
     start = max(1, min(start, protein_length))
     end = max(start, min(end, protein_length))
 
-    positions = coord_mapper.get_protein_range(gene_upper, start, end)
+    pos_df = coord_mapper.get_protein_range_df(gene_upper, start, end)
 
-    if not positions:
+    if pos_df is None or pos_df.is_empty():
         raise HTTPException(
             status_code=404,
             detail=f"No positions found for {gene} residues {start}-{end}"
         )
 
-    # Get constraint data from axis table
+    # Join the annotation columns onto the codon positions relationally
+    # instead of probing a per-position Python dict in the loop below
+    annotation_cols = [
+        'filtered_idx',
+        'clinvar.clinvar_count',
+        'clinvar.clinvar_label_list',
+        'dbnsfp.max_AlphaMissense_am_pathogenicity',
+        'dbnsfp.max_RGC_MTR_MTR',
+        'rgc_mis_count',
+        'rgc_mis_exomes_XX_XY_21bp_oe_af0epos00',
+    ]
+
+    merged = pos_df
+    gene_data = None
     if filter_id in axis_tables and include_constraints:
-        axis_table = axis_tables[filter_id]
-        # Filter and collect from lazy frame
-        gene_data = axis_table.filter(
-            pl.col('gene_symbol').str.to_uppercase() == gene_upper
-        ).collect()
-        pos_to_data = {}
-        for row in gene_data.to_dicts():
-            pos_to_data[(row['chrom'], row['pos'])] = row
-    else:
-        pos_to_data = {}
-
-    # Get pLDDT scores
-    plddt_by_residue = {}
-    if include_plddt and metadata:
-        plddt_by_residue = metadata.get('plddt_by_residue', {})
+        gene_data = get_gene_df(filter_id, gene_upper)
+    # gene_data is None when the gene is absent from this filter's axis
+    # table; fall through with bare codon positions (empty annotations)
+    if gene_data is not None:
+        present_cols = [c for c in annotation_cols if c in gene_data.columns]
+        merged = pos_df.join(
+            gene_data.select(['chrom', 'pos'] + present_cols).with_columns(
+                pl.lit(True).alias('_matched')
+            ),
+            on=['chrom', 'pos'],
+            how='left',
+        ).sort(['protein_residue', 'codon_position'])
+
+    def get_column(name, sanitize=False):
+        """Column values as a list, or None if the column is absent."""
+        if name not in merged.columns:
+            return None
+        if sanitize:
+            return sanitize_float_array(merged[name])
+        return merged[name].to_list()
+
+    residue_col = merged['protein_residue'].to_list()
+    aa_col = merged['ref_aa'].to_list()
+    chrom_col = merged['chrom'].to_list()
+    pos_col = merged['pos'].to_list()
+    codon_col = merged['codon_position'].to_list()
+    matched_col = get_column('_matched')
+    filtered_idx_col = get_column('filtered_idx')
+    clinvar_count_col = get_column('clinvar.clinvar_count')
+    clinvar_labels_col = get_column('clinvar.clinvar_label_list')
+    alphamissense_col = get_column('dbnsfp.max_AlphaMissense_am_pathogenicity', sanitize=True)
+    mtr_col = get_column('dbnsfp.max_RGC_MTR_MTR', sanitize=True)
+    mis_count_col = get_column('rgc_mis_count')
+    mis_oe_col = get_column('rgc_mis_exomes_XX_XY_21bp_oe_af0epos00', sanitize=True)
+
+    # Get pLDDT scores from the dense residue-indexed array
+    plddt_arr = coord_mapper.get_plddt_array(gene_upper) if include_plddt else None
+
+    def plddt_at(residue: int) -> Optional[float]:
+        if plddt_arr is not None and 0 <= residue < len(plddt_arr):
+            value = plddt_arr[residue]
+            if np.isfinite(value):
+                return float(value)
+        return None
 
     # Build residue-level response
     residues = []
     current_residue = None
     residue_data = None
 
-    for pos_info in positions:
-        residue_num = pos_info['protein_residue']
+    for i in range(len(residue_col)):
+        residue_num = residue_col[i]
 
         if residue_num != current_residue:
             if residue_data is not None:
@@ -646,33 +1126,25 @@ async def get_protein_residues(
             current_residue = residue_num
             residue_data = {
                 'residue': residue_num,
-                'amino_acid': pos_info['ref_aa'],
+                'amino_acid': aa_col[i],
                 'genomic_positions': [],
-                'plddt': plddt_by_residue.get(str(residue_num)) or plddt_by_residue.get(residue_num),
+                'plddt': plddt_at(residue_num),
             }
 
-        pos_key = (pos_info['chrom'], pos_info['pos'])
         genomic_info = {
-            'chrom': pos_info['chrom'],
-            'pos': pos_info['pos'],
-            'codon_position': pos_info['codon_position'],
+            'chrom': chrom_col[i],
+            'pos': pos_col[i],
+            'codon_position': codon_col[i],
         }
 
-        if pos_key in pos_to_data:
-            constraint_data = pos_to_data[pos_key]
-            genomic_info['filtered_idx'] = constraint_data.get('filtered_idx')
-            genomic_info['clinvar_count'] = constraint_data.get('clinvar.clinvar_count', 0)
-            genomic_info['clinvar_labels'] = constraint_data.get('clinvar.clinvar_label_list')
-            genomic_info['alphamissense'] = sanitize_float(
-                constraint_data.get('dbnsfp.max_AlphaMissense_am_pathogenicity')
-            )
-            genomic_info['mtr'] = sanitize_float(
-                constraint_data.get('dbnsfp.max_RGC_MTR_MTR')
-            )
-            genomic_info['mis_count'] = constraint_data.get('rgc_mis_count')
-            genomic_info['mis_oe_21bp'] = sanitize_float(
-                constraint_data.get('rgc_mis_exomes_XX_XY_21bp_oe_af0epos00')
-            )
+        if matched_col is not None and matched_col[i]:
+            genomic_info['filtered_idx'] = filtered_idx_col[i] if filtered_idx_col else None
+            genomic_info['clinvar_count'] = clinvar_count_col[i] if clinvar_count_col else 0
+            genomic_info['clinvar_labels'] = clinvar_labels_col[i] if clinvar_labels_col else None
+            genomic_info['alphamissense'] = alphamissense_col[i] if alphamissense_col else None
+            genomic_info['mtr'] = mtr_col[i] if mtr_col else None
+            genomic_info['mis_count'] = mis_count_col[i] if mis_count_col else None
+            genomic_info['mis_oe_21bp'] = mis_oe_col[i] if mis_oe_col else None
 
         residue_data['genomic_positions'].append(genomic_info)
 
@@ -688,22 +1160,39 @@ async def get_protein_residues(
     }
 
 
-@app.get("/api/protein/{gene}/residue-scores")
-async def get_residue_scores(
+@app.get("/api/protein/{gene}/residues")
+async def get_protein_residues(
     gene: str,
-    field: str = Query(..., description="Field ID to aggregate"),
-    aggregation: str = Query("max", description="Aggregation method: max, min, or mean"),
+    start: int = Query(1, ge=1, description="Start residue (1-based)"),
+    end: int = Query(None, description="End residue (defaults to protein length)"),
     filter_id: str = Query("missense_only", description="Filter ID for constraint data"),
+    include_plddt: bool = Query(True, description="Include pLDDT scores"),
+    include_constraints: bool = Query(True, description="Include constraint metrics"),
 ):
-    """Get aggregated scores per residue for a specific field."""
-    gene_upper = gene.upper()
+    """Get per-residue data for a protein region."""
+    if not coord_mapper.has_gene(gene.upper()):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Gene {gene} not found. Currently only SCN2A is supported."
+        )
 
-    if not coord_mapper.has_gene(gene_upper):
-        raise HTTPException(status_code=404, detail=f"Gene {gene} not found")
+    # Run the per-residue assembly off the event loop
+    payload = await anyio.to_thread.run_sync(
+        _compute_protein_residues, gene, start, end, filter_id,
+        include_plddt, include_constraints
+    )
+    return ORJSONResponse(payload, headers=CACHEABLE_HEADERS)
 
-    if filter_id not in axis_tables:
-        raise HTTPException(status_code=400, detail=f"Filter {filter_id} not available")
 
+@lru_cache(maxsize=512)
+def _compute_residue_scores(
+    gene_upper: str, field: str, aggregation: str, filter_id: str
+) -> Dict[str, Any]:
+    """Aggregate per-residue scores (runs in a worker thread).
+
+    Deterministic for the process lifetime, so results are memoized per
+    query; treat the returned payload as read-only.
+    """
     metadata = coord_mapper.get_structure_metadata(gene_upper)
     protein_length = metadata.get('protein_length', 2005) if metadata else 2005
 
@@ -712,60 +1201,59 @@ async def get_residue_scores(
     if not positions:
         return {"gene_symbol": gene_upper, "field": field, "scores": {}, "range": [None, None]}
 
-    axis_table = axis_tables[filter_id]
-    # Filter and collect from lazy frame
-    gene_data = axis_table.filter(
-        pl.col('gene_symbol').str.to_uppercase() == gene_upper
-    ).collect()
-
-    pos_to_data = {}
-    for row in gene_data.to_dicts():
-        pos_to_data[(row['chrom'], row['pos'])] = row
+    # Cached gene slice; only the requested field is read
+    gene_data, _ = get_gene_pos_index(filter_id, gene_upper)
 
     is_constraint_stacked = field in CONSTRAINT_STACKED_FIELDS
     is_dbnsfp_stacked = field in DBNSFP_STACKED_FIELDS
-    residue_values = {}
 
-    for pos_info in positions:
-        residue_num = pos_info['protein_residue']
-        pos_key = (pos_info['chrom'], pos_info['pos'])
+    # Vectorized aggregation: join the protein map with the gene slice on
+    # (chrom, pos), extract scores, then group_by residue in native Polars
+    scores_df = None
+    protein_map = coord_mapper.get_protein_map(gene_upper)
+    if gene_data is not None and protein_map is not None and field in gene_data.columns:
+        positions_df = protein_map.select(
+            ['chrom', 'pos', 'protein_residue']
+        )
+        joined = positions_df.join(
+            gene_data.select(['chrom', 'pos', field]),
+            on=['chrom', 'pos'], how='inner'
+        )
 
-        if pos_key in pos_to_data:
-            constraint_data = pos_to_data[pos_key]
-            value = constraint_data.get(field)
+        if is_constraint_stacked or is_dbnsfp_stacked:
+            # Both constraint and dbNSFP stacked fields store score in _1
+            joined = joined.explode(field).filter(
+                pl.col(field).is_not_null()
+            ).with_columns(
+                pl.col(field).struct.field('_1').cast(pl.Float64).alias('_score')
+            )
+        else:
+            joined = joined.with_columns(
+                pl.col(field).cast(pl.Float64).alias('_score')
+            )
 
-            if value is None:
-                continue
+        joined = joined.filter(
+            pl.col('_score').is_not_null() & pl.col('_score').is_not_nan()
+        )
 
-            if is_constraint_stacked or is_dbnsfp_stacked:
-                # Both constraint and dbNSFP stacked fields store score in _1
-                if isinstance(value, list):
-                    for variant in value:
-                        if isinstance(variant, dict):
-                            score = variant.get('_1')
-                            if score is not None and not (isinstance(score, float) and (score != score)):
-                                if residue_num not in residue_values:
-                                    residue_values[residue_num] = []
-                                residue_values[residue_num].append(float(score))
-            else:
-                if not (isinstance(value, float) and (value != value)):
-                    if residue_num not in residue_values:
-                        residue_values[residue_num] = []
-                    residue_values[residue_num].append(float(value))
-
-    scores = {}
-    all_values = []
-
-    for residue, values in residue_values.items():
-        if aggregation == 'max':
-            score = max(values)
-        elif aggregation == 'min':
-            score = min(values)
-        else:
-            score = sum(values) / len(values)
+        if joined.height > 0:
+            agg_expr = {
+                'max': pl.col('_score').max(),
+                'min': pl.col('_score').min(),
+            }.get(aggregation, pl.col('_score').mean())
+            scores_df = joined.group_by('protein_residue').agg(
+                agg_expr.alias('_score')
+            )
 
-        scores[residue] = round(score, 4)
-        all_values.append(score)
+    if scores_df is not None:
+        all_values = scores_df['_score'].to_list()
+        scores = {
+            residue: round(score, 4)
+            for residue, score in zip(scores_df['protein_residue'].to_list(), all_values)
+        }
+    else:
+        all_values = []
+        scores = {}
 
     if is_constraint_stacked:
         value_range = [0.0, 1.0]
@@ -790,6 +1278,28 @@ async def get_residue_scores(
     }
 
 
+@app.get("/api/protein/{gene}/residue-scores")
+async def get_residue_scores(
+    gene: str,
+    field: str = Query(..., description="Field ID to aggregate"),
+    aggregation: str = Query("max", description="Aggregation method: max, min, or mean"),
+    filter_id: str = Query("missense_only", description="Filter ID for constraint data"),
+):
+    """Get aggregated scores per residue for a specific field."""
+    gene_upper = gene.upper()
+
+    if not coord_mapper.has_gene(gene_upper):
+        raise HTTPException(status_code=404, detail=f"Gene {gene} not found")
+
+    if filter_id not in axis_tables:
+        raise HTTPException(status_code=400, detail=f"Filter {filter_id} not available")
+
+    payload = await anyio.to_thread.run_sync(
+        _compute_residue_scores, gene_upper, field, aggregation, filter_id
+    )
+    return ORJSONResponse(payload, headers=CACHEABLE_HEADERS)
+
+
 @app.get("/api/protein/{gene}/coordinate-map")
 async def get_coordinate_map(
     gene: str,
@@ -843,30 +1353,25 @@ async def get_coordinate_map(
 # Structure API Endpoints
 # =============================================================================
 
-@app.get("/api/structure/{gene}")
-async def get_structure(gene: str):
-    """Get structure information for a gene."""
-    gene_upper = gene.upper()
-    data_dir = get_data_dir()
+@lru_cache(maxsize=64)
+def _compute_structure_info(gene_upper: str) -> Optional[Dict[str, Any]]:
+    """Build the structure-info payload, memoized per gene.
 
-    metadata = coord_mapper.get_structure_metadata(gene_upper)
-    if not metadata:
-        raise HTTPException(
-            status_code=404,
-            detail=f"No structure data available for {gene}. Currently only SCN2A is supported."
-        )
-
-    structures = metadata.get('structures', {})
+    Metadata is immutable after startup; treat the result as read-only.
+    """
+    view = coord_mapper.get_structure_view(gene_upper)
+    if view is None:
+        return None
 
     response = {
         "gene_symbol": gene_upper,
-        "uniprot_accession": metadata.get('uniprot_accession'),
-        "protein_length": metadata.get('protein_length'),
-        "available_structures": list(structures.keys()),
+        "uniprot_accession": view.uniprot_accession,
+        "protein_length": view.protein_length,
+        "available_structures": list(view.available_structures),
     }
 
-    if 'alphafold' in structures:
-        af = structures['alphafold']
+    if view.alphafold is not None:
+        af = view.alphafold
         response['alphafold'] = {
             'id': af.get('id'),
             'version': af.get('version'),
@@ -875,78 +1380,108 @@ async def get_structure(gene: str):
             'min_plddt': af.get('min_plddt'),
             'max_plddt': af.get('max_plddt'),
             'confidence_distribution': af.get('confidence_distribution'),
-            'file_url': f"/api/structure/{gene}/file/alphafold"
+            'file_url': f"/api/structure/{gene_upper}/file/alphafold"
         }
 
-    response['domains'] = metadata.get('domains', [])
+    response['domains'] = list(view.domains)
 
     return response
 
 
-@app.get("/api/structure/{gene}/file/{structure_type}")
-async def get_structure_file(gene: str, structure_type: str):
-    """Get the actual structure file (PDB format) for a gene."""
-    gene_upper = gene.upper()
-    data_dir = get_data_dir()
-
-    metadata = coord_mapper.get_structure_metadata(gene_upper)
-    if not metadata:
+@app.get("/api/structure/{gene}")
+async def get_structure(gene: str):
+    """Get structure information for a gene."""
+    response = _compute_structure_info(gene.upper())
+    if response is None:
         raise HTTPException(
             status_code=404,
-            detail=f"No structure data available for {gene}"
+            detail=f"No structure data available for {gene}. Currently only SCN2A is supported."
         )
+    return ORJSONResponse(response, headers=CACHEABLE_HEADERS)
+
 
-    structures = metadata.get('structures', {})
+@lru_cache(maxsize=64)
+def _resolve_structure_file(gene_upper: str, structure_type: str) -> Optional[Path]:
+    """Resolve a structure file path from metadata, memoized per lookup."""
+    view = coord_mapper.get_structure_view(gene_upper)
+    if view is None or structure_type not in view.file_names:
+        return None
 
-    if structure_type not in structures:
+    return DATA_DIR / view.file_names[structure_type]
+
+
+@lru_cache(maxsize=64)
+def _structure_file_etag(path_str: str, mtime_ns: int, size: int) -> str:
+    """Content hash for a structure file, recomputed only when it changes."""
+    return hashlib.blake2b(Path(path_str).read_bytes(), digest_size=8).hexdigest()
+
+
+@app.get("/api/structure/{gene}/file/{structure_type}")
+async def get_structure_file(gene: str, structure_type: str, request: Request):
+    """Get the actual structure file (PDB format) for a gene."""
+    file_path = _resolve_structure_file(gene.upper(), structure_type)
+    if file_path is None:
         raise HTTPException(
             status_code=404,
             detail=f"Structure type {structure_type} not available for {gene}"
         )
 
-    structure_info = structures[structure_type]
-    file_path = data_dir / structure_info.get('file', '')
-
     if not file_path.exists():
         raise HTTPException(
             status_code=404,
             detail=f"Structure file not found: {file_path}"
         )
 
+    # Structure files are immutable per version, so let browsers and
+    # proxies keep them for a week and answer revalidations with a 304
+    stat = file_path.stat()
+    etag = '"{}"'.format(await anyio.to_thread.run_sync(
+        _structure_file_etag, str(file_path), stat.st_mtime_ns, stat.st_size
+    ))
+    headers = {
+        "Cache-Control": "public, max-age=604800, immutable",
+        "ETag": etag,
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
     return FileResponse(
         path=file_path,
         media_type="chemical/x-pdb",
-        filename=file_path.name
+        filename=file_path.name,
+        headers=headers
     )
 
 
-@app.get("/api/structure/{gene}/plddt")
-async def get_plddt_scores(
-    gene: str,
-    start: int = Query(1, ge=1),
-    end: int = Query(None),
-):
-    """Get pLDDT scores for a range of residues."""
-    gene_upper = gene.upper()
-
+@lru_cache(maxsize=256)
+def _compute_plddt_scores(gene_upper: str, start: int, end: Optional[int]) -> Optional[Dict[str, Any]]:
+    """Build the pLDDT payload, memoized per query; treat as read-only."""
     metadata = coord_mapper.get_structure_metadata(gene_upper)
     if not metadata:
-        raise HTTPException(
-            status_code=404,
-            detail=f"No structure data available for {gene}"
-        )
+        return None
 
-    plddt_by_residue = metadata.get('plddt_by_residue', {})
-    protein_length = metadata.get('protein_length', len(plddt_by_residue))
+    plddt_arr = coord_mapper.get_plddt_array(gene_upper)
+    protein_length = metadata.get('protein_length', len(plddt_arr) - 1 if plddt_arr is not None else 0)
 
     if end is None:
         end = protein_length
 
     scores = []
-    for residue in range(start, end + 1):
-        score = plddt_by_residue.get(str(residue)) or plddt_by_residue.get(residue)
-        if score is not None:
-            scores.append({'residue': residue, 'plddt': score})
+    if plddt_arr is not None:
+        # Slice the dense residue-indexed array; one isfinite pass replaces
+        # two dict probes per residue
+        hi = min(end, len(plddt_arr) - 1)
+        if hi >= start:
+            sliced = plddt_arr[start:hi + 1]
+            finite = np.isfinite(sliced)
+            scores = [
+                {'residue': residue, 'plddt': score}
+                for residue, score, ok in zip(
+                    range(start, hi + 1), sliced.tolist(), finite.tolist()
+                )
+                if ok
+            ]
 
     return {
         "gene_symbol": gene_upper,
@@ -955,11 +1490,28 @@ async def get_plddt_scores(
     }
 
 
+@app.get("/api/structure/{gene}/plddt")
+async def get_plddt_scores(
+    gene: str,
+    start: int = Query(1, ge=1),
+    end: int = Query(None),
+):
+    """Get pLDDT scores for a range of residues."""
+    payload = _compute_plddt_scores(gene.upper(), start, end)
+    if payload is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No structure data available for {gene}"
+        )
+    return ORJSONResponse(payload, headers=CACHEABLE_HEADERS)
+
+
 @app.get("/api/structure/{gene}/residue-data")
 async def get_structure_residue_data(
     gene: str,
     residues: str = Query(..., description="Comma-separated list of residue numbers"),
     filter_id: str = Query("missense_only"),
+    format: str = Query("json", description="Response format: 'json' or 'ndjson' (one residue per line, streamed)"),
 ):
     """Get combined structure and constraint data for specific residues."""
     gene_upper = gene.upper()
@@ -975,59 +1527,62 @@ async def get_structure_residue_data(
             detail="Invalid residue format. Provide comma-separated integers."
         )
 
-    metadata = coord_mapper.get_structure_metadata(gene_upper)
-    plddt_by_residue = metadata.get('plddt_by_residue', {}) if metadata else {}
-
-    axis_table = axis_tables.get(filter_id)
-    gene_data = {}
-    if axis_table is not None:
-        gene_rows = axis_table.filter(
-            pl.col('gene_symbol').str.to_uppercase() == gene_upper
+    plddt_arr = coord_mapper.get_plddt_array(gene_upper)
+
+    def plddt_at(residue: int) -> Optional[float]:
+        if plddt_arr is not None and 0 <= residue < len(plddt_arr):
+            value = plddt_arr[residue]
+            if np.isfinite(value):
+                return float(value)
+        return None
+
+    # Aggregates are precomputed once per (filter, gene); each requested
+    # residue is a dict lookup rather than a cross-position scan. The
+    # first build for a gene walks every mapped residue, so it runs on a
+    # worker thread to keep the event loop responsive
+    if filter_id in axis_tables:
+        aggregates = await anyio.to_thread.run_sync(
+            get_residue_aggregates, filter_id, gene_upper
         )
-        for row in gene_rows.to_dicts():
-            gene_data[(row['chrom'], row['pos'])] = row
+    else:
+        aggregates = {}
 
-    residue_data = []
-    for residue in residue_list:
-        positions = coord_mapper.protein_to_genomic(gene_upper, residue)
-        if not positions:
-            continue
+    # One filter pass over the protein map instead of one per residue
+    positions_by_residue = coord_mapper.protein_to_genomic_many(gene_upper, residue_list)
 
-        clinvar_count = 0
-        clinvar_labels = []
-        max_alphamissense = None
-        filtered_indices = []
+    def iter_residues():
+        for residue in residue_list:
+            positions = positions_by_residue.get(residue)
+            if not positions:
+                continue
 
-        for pos in positions:
-            key = (pos['chrom'], pos['pos'])
-            if key in gene_data:
-                data = gene_data[key]
-                clinvar_count += data.get('clinvar.clinvar_count', 0) or 0
-                labels = data.get('clinvar.clinvar_label_list')
-                if labels:
-                    if isinstance(labels, list):
-                        clinvar_labels.extend(labels)
-                    else:
-                        clinvar_labels.append(labels)
-
-                am = data.get('dbnsfp.max_AlphaMissense_am_pathogenicity')
-                if am is not None and not math.isnan(am):
-                    if max_alphamissense is None or am > max_alphamissense:
-                        max_alphamissense = am
-
-                if data.get('filtered_idx') is not None:
-                    filtered_indices.append(data['filtered_idx'])
-
-        residue_data.append({
-            'residue': residue,
-            'amino_acid': positions[0]['ref_aa'] if positions else None,
-            'plddt': plddt_by_residue.get(str(residue)) or plddt_by_residue.get(residue),
-            'clinvar_count': clinvar_count,
-            'clinvar_labels': list(set(clinvar_labels)),
-            'max_alphamissense': sanitize_float(max_alphamissense),
-            'filtered_indices': filtered_indices,
-            'genomic_positions': positions
-        })
+            clinvar_count, clinvar_labels, max_alphamissense, filtered_indices = (
+                aggregates.get(residue, (0, [], None, []))
+            )
+
+            yield {
+                'residue': residue,
+                'amino_acid': positions[0]['ref_aa'] if positions else None,
+                'plddt': plddt_at(residue),
+                'clinvar_count': clinvar_count,
+                'clinvar_labels': list(clinvar_labels),
+                'max_alphamissense': sanitize_float(max_alphamissense),
+                'filtered_indices': filtered_indices,
+                'genomic_positions': positions
+            }
+
+    if format == 'ndjson':
+        # Stream one residue per line so the client can parse while the
+        # server is still serializing the rest of a large batch
+        def stream():
+            for item in iter_residues():
+                yield orjson.dumps(item) + b"\n"
+        return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+    if format != 'json':
+        raise HTTPException(status_code=400, detail="format must be 'json' or 'ndjson'")
+
+    residue_data = list(iter_residues())
 
     return {
         "gene_symbol": gene_upper,
@@ -5,13 +5,20 @@ Loads configuration from config/paths.yaml with support for environment variable
 """
 
 import os
+import orjson
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
-    """Get the project root directory (where config/ lives)."""
+    """Get the project root directory (where config/ lives).
+
+    The answer is fixed for the process lifetime, so the directory walk
+    (one stat per level) runs only once.
+    """
     # Start from this file's location and go up to find project root
     current = Path(__file__).resolve().parent  # browser/backend/
 
@@ -25,6 +32,34 @@ def get_project_root() -> Path:
     return Path.cwd()
 
 
+def _read_config_file(config_path: Path) -> Dict[str, Any]:
+    """Parse the config file, using a JSON sidecar to skip YAML when fresh.
+
+    YAML parsing dominates config load time, so the parsed config is
+    cached as `paths.yaml.json` next to the source. The sidecar is used
+    only when at least as new as the YAML, so editing paths.yaml
+    invalidates it; the cache is best-effort and the YAML stays the
+    source of truth.
+    """
+    sidecar = config_path.with_suffix(config_path.suffix + '.json')
+    try:
+        if sidecar.stat().st_mtime >= config_path.stat().st_mtime:
+            with open(sidecar, 'rb') as f:
+                return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        pass
+
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f)
+
+    try:
+        sidecar.write_bytes(orjson.dumps(config))
+    except (TypeError, OSError):
+        pass
+
+    return config
+
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from YAML file.
@@ -46,8 +81,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         print(f"Warning: Config file not found at {config_path}, using defaults")
         return get_default_config()
 
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = _read_config_file(config_path)
 
     # Ensure browser section exists with defaults
     if 'browser' not in config:
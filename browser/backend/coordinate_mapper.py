@@ -7,9 +7,28 @@ Uses precomputed mapping tables for fast lookups.
 
 import json
 import math
+from operator import itemgetter
+import numpy as np
 import polars as pl
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class StructureView:
+    """Pre-resolved, immutable view of a gene's structure metadata.
+
+    Flattens the nested metadata dicts once at load so request handlers
+    do a single attribute access instead of chained .get() calls.
+    """
+    gene_symbol: str
+    uniprot_accession: Optional[str]
+    protein_length: Optional[int]
+    available_structures: Tuple[str, ...]
+    alphafold: Optional[Dict]
+    domains: Tuple[Dict, ...]
+    file_names: Dict[str, str]  # structure_type -> file path relative to data dir
 
 
 class CoordinateMapper:
@@ -21,15 +40,112 @@ class CoordinateMapper:
     def __init__(self):
         self.protein_maps: Dict[str, pl.DataFrame] = {}
         self.structure_metadata: Dict[str, Dict] = {}
+        # gene -> flattened StructureView over structure_metadata
+        self.structure_views: Dict[str, StructureView] = {}
+        # gene -> dense residue-indexed pLDDT array (NaN where unknown)
+        self.plddt_arrays: Dict[str, np.ndarray] = {}
+        # (gene, start_residue, end_residue) -> cached get_protein_range result
+        self._range_cache: Dict[tuple, List[Dict]] = {}
+        # Same keys, DataFrame form for relational joins in the backend
+        self._range_df_cache: Dict[tuple, pl.DataFrame] = {}
+        # Point-lookup indexes built once per gene: columnar lists plus
+        # (chrom, pos) -> row and residue -> [rows], so the mapper methods
+        # never run a Polars filter per request
+        self._map_columns: Dict[str, tuple] = {}
+        self._gp_index: Dict[str, Dict[tuple, int]] = {}
+        self._pg_index: Dict[str, Dict[int, List[int]]] = {}
+        # gene -> on-disk map path, registered at startup but read lazily
+        # on first access so unqueried genes never pay parquet decode
+        self._map_paths: Dict[str, Path] = {}
+        # gene -> sorted residue column as a NumPy array, for binary-search
+        # range bounds in get_protein_range
+        self._residue_arrays: Dict[str, np.ndarray] = {}
+
+    def register_map_path(self, gene_symbol: str, map_path: Path) -> None:
+        """Record where a gene's protein map lives without loading it.
+
+        The map is read and indexed on first access via _ensure_loaded,
+        keeping startup time and RSS independent of how many genes are
+        configured.
+        """
+        self._map_paths[gene_symbol.upper()] = map_path
+
+    def _ensure_loaded(self, gene_upper: str) -> None:
+        """Load a registered-but-unloaded protein map on first access."""
+        if gene_upper in self.protein_maps:
+            return
+        map_path = self._map_paths.get(gene_upper)
+        if map_path is not None:
+            self.load_protein_map(gene_upper, map_path)
 
     def load_protein_map(self, gene_symbol: str, map_path: Path) -> bool:
-        """Load a precomputed protein mapping table for a gene."""
+        """Load a precomputed protein mapping table for a gene.
+
+        Prefers a memory-mapped Arrow IPC twin (.arrow) when one sits next
+        to the parquet (see scripts/convert_protein_maps_to_ipc.py).
+        """
+        ipc_path = map_path.with_suffix('.arrow')
+        if ipc_path.exists():
+            self.register_protein_map(gene_symbol, pl.read_ipc(ipc_path, memory_map=True))
+            return True
+
         if not map_path.exists():
             return False
 
-        self.protein_maps[gene_symbol.upper()] = pl.read_parquet(map_path)
+        self.register_protein_map(gene_symbol, pl.read_parquet(map_path))
         return True
 
+    def register_protein_map(self, gene_symbol: str, protein_map: pl.DataFrame) -> None:
+        """Register an already-loaded protein mapping table for a gene."""
+        gene_upper = gene_symbol.upper()
+        # Canonicalize to residue order once, so range queries are
+        # contiguous slices and never re-sort; build scripts already emit
+        # this order, making the sort a cheap no-op check in practice
+        protein_map = protein_map.sort(['protein_residue', 'codon_position'])
+        # Decode dictionary-encoded string columns back to Utf8: the build
+        # scripts write categoricals for on-disk compactness, but the residue
+        # endpoints join this table against Utf8 axis columns and Polars
+        # rejects cat-vs-str join keys
+        cat_cols = [
+            name for name, dtype in protein_map.schema.items()
+            if dtype == pl.Categorical
+        ]
+        if cat_cols:
+            protein_map = protein_map.with_columns(
+                [pl.col(col).cast(pl.Utf8) for col in cat_cols]
+            )
+        self.protein_maps[gene_upper] = protein_map
+
+        # Build point-lookup indexes in one pass over the columns
+        chroms = protein_map['chrom'].to_list()
+        positions = protein_map['pos'].to_list()
+        residues = protein_map['protein_residue'].to_list()
+        codons = protein_map['codon_position'].to_list()
+        ref_aas = protein_map['ref_aa'].to_list()
+        if 'cds_offset' in protein_map.columns:
+            cds_offsets = protein_map['cds_offset'].to_list()
+        else:
+            cds_offsets = [None] * len(chroms)
+
+        gp_index: Dict[tuple, int] = {}
+        pg_index: Dict[int, List[int]] = {}
+        for i, (chrom, pos, residue) in enumerate(zip(chroms, positions, residues)):
+            gp_index[(chrom, pos)] = i
+            pg_index.setdefault(residue, []).append(i)
+
+        self._map_columns[gene_upper] = (chroms, positions, residues, codons, ref_aas, cds_offsets)
+        self._residue_arrays[gene_upper] = protein_map['protein_residue'].to_numpy()
+        self._gp_index[gene_upper] = gp_index
+        self._pg_index[gene_upper] = pg_index
+
+        # Drop any stale cached ranges and pre-warm the full-protein range,
+        # which residue-scores/residues endpoints request on every call
+        self._range_cache = {k: v for k, v in self._range_cache.items() if k[0] != gene_upper}
+        self._range_df_cache = {k: v for k, v in self._range_df_cache.items() if k[0] != gene_upper}
+        max_residue = protein_map['protein_residue'].max()
+        if max_residue is not None:
+            self.get_protein_range(gene_upper, 1, int(max_residue))
+
     def load_structure_metadata(self, metadata_path: Path) -> bool:
         """Load structure metadata JSON."""
         if not metadata_path.exists():
@@ -42,6 +158,43 @@ class CoordinateMapper:
         if gene_symbol:
             self.structure_metadata[gene_symbol] = metadata
 
+            structures = metadata.get('structures', {})
+            self.structure_views[gene_symbol] = StructureView(
+                gene_symbol=gene_symbol,
+                uniprot_accession=metadata.get('uniprot_accession'),
+                protein_length=metadata.get('protein_length'),
+                available_structures=tuple(structures.keys()),
+                alphafold=structures.get('alphafold'),
+                domains=tuple(metadata.get('domains', [])),
+                file_names={
+                    structure_type: info.get('file', '')
+                    for structure_type, info in structures.items()
+                },
+            )
+
+            # Densify pLDDT into a residue-indexed array so hot endpoints
+            # do one array index instead of dual str/int dict probes
+            plddt_by_residue = metadata.get('plddt_by_residue') or {}
+            residue_keys = []
+            for key in plddt_by_residue:
+                try:
+                    residue_keys.append(int(key))
+                except (TypeError, ValueError):
+                    continue
+            protein_length = metadata.get('protein_length') or (
+                max(residue_keys) if residue_keys else 0
+            )
+            if protein_length:
+                arr = np.full(protein_length + 1, np.nan)
+                for key, value in plddt_by_residue.items():
+                    try:
+                        residue = int(key)
+                    except (TypeError, ValueError):
+                        continue
+                    if value is not None and 0 <= residue <= protein_length:
+                        arr[residue] = value
+                self.plddt_arrays[gene_symbol] = arr
+
         return True
 
     def genomic_to_protein(self, gene: str, chrom: str, pos: int) -> Optional[Dict]:
@@ -52,24 +205,17 @@ class CoordinateMapper:
             Dict with protein_residue, codon_position, ref_aa, or None if not found
         """
         gene_upper = gene.upper()
-        if gene_upper not in self.protein_maps:
+        self._ensure_loaded(gene_upper)
+        row_no = self._gp_index.get(gene_upper, {}).get((chrom, pos))
+        if row_no is None:
             return None
 
-        protein_map = self.protein_maps[gene_upper]
-        result = protein_map.filter(
-            (pl.col('chrom') == chrom) &
-            (pl.col('pos') == pos)
-        )
-
-        if len(result) == 0:
-            return None
-
-        row = result.to_dicts()[0]
+        _, _, residues, codons, ref_aas, cds_offsets = self._map_columns[gene_upper]
         return {
-            'protein_residue': row['protein_residue'],
-            'codon_position': row['codon_position'],
-            'ref_aa': row['ref_aa'],
-            'cds_offset': row['cds_offset']
+            'protein_residue': residues[row_no],
+            'codon_position': codons[row_no],
+            'ref_aa': ref_aas[row_no],
+            'cds_offset': cds_offsets[row_no]
         }
 
     def protein_to_genomic(self, gene: str, residue: int) -> List[Dict]:
@@ -80,58 +226,175 @@ class CoordinateMapper:
             List of dicts with chrom, pos, codon_position for each base in the codon
         """
         gene_upper = gene.upper()
-        if gene_upper not in self.protein_maps:
-            return []
-
-        protein_map = self.protein_maps[gene_upper]
-        results = protein_map.filter(pl.col('protein_residue') == residue)
-
-        if len(results) == 0:
+        self._ensure_loaded(gene_upper)
+        row_nos = self._pg_index.get(gene_upper, {}).get(residue)
+        if not row_nos:
             return []
 
+        chroms, positions, _, codons, ref_aas, _ = self._map_columns[gene_upper]
         return [
             {
-                'chrom': row['chrom'],
-                'pos': row['pos'],
-                'codon_position': row['codon_position'],
-                'ref_aa': row['ref_aa']
+                'chrom': chroms[i],
+                'pos': positions[i],
+                'codon_position': codons[i],
+                'ref_aa': ref_aas[i]
             }
-            for row in results.to_dicts()
+            for i in row_nos
         ]
 
+    def protein_to_genomic_many(self, gene: str, residues: List[int]) -> Dict[int, List[Dict]]:
+        """Map many protein residues to genomic positions in one filter pass.
+
+        Returns:
+            Dict of residue -> list of dicts with chrom, pos, codon_position,
+            ref_aa (same shape as protein_to_genomic); residues with no
+            mapping are absent from the dict
+        """
+        gene_upper = gene.upper()
+        self._ensure_loaded(gene_upper)
+        pg_index = self._pg_index.get(gene_upper)
+        if pg_index is None:
+            return {}
+
+        chroms, positions, _, codons, ref_aas, _ = self._map_columns[gene_upper]
+        positions_by_residue: Dict[int, List[Dict]] = {}
+        for residue in residues:
+            row_nos = pg_index.get(residue)
+            if row_nos:
+                positions_by_residue[residue] = [
+                    {
+                        'chrom': chroms[i],
+                        'pos': positions[i],
+                        'codon_position': codons[i],
+                        'ref_aa': ref_aas[i]
+                    }
+                    for i in row_nos
+                ]
+
+        return positions_by_residue
+
+    def get_residue_numbers(self, gene: str) -> List[int]:
+        """All mapped residue numbers for a gene, sorted ascending."""
+        gene_upper = gene.upper()
+        self._ensure_loaded(gene_upper)
+        pg_index = self._pg_index.get(gene_upper)
+        if pg_index is None:
+            return []
+        return sorted(pg_index)
+
+    def _residue_bounds(self, gene_upper: str, start_residue: int, end_residue: int) -> tuple:
+        """Row bounds [lo, hi) for a residue range in the sorted map.
+
+        Binary search on the sorted residue column, so a range query is
+        O(log N) bound lookup plus an O(k) contiguous slice.
+        """
+        residue_array = self._residue_arrays[gene_upper]
+        lo = int(np.searchsorted(residue_array, start_residue, side='left'))
+        hi = int(np.searchsorted(residue_array, end_residue + 1, side='left'))
+        return lo, hi
+
     def get_protein_range(self, gene: str, start_residue: int, end_residue: int) -> List[Dict]:
-        """Get all genomic positions for a range of protein residues."""
+        """Get all genomic positions for a range of protein residues.
+
+        Results are memoized per (gene, start, end) since the mapping is
+        invariant for the process lifetime; treat the returned list as
+        read-only.
+        """
         gene_upper = gene.upper()
+        self._ensure_loaded(gene_upper)
         if gene_upper not in self.protein_maps:
             return []
 
-        protein_map = self.protein_maps[gene_upper]
-        results = protein_map.filter(
-            (pl.col('protein_residue') >= start_residue) &
-            (pl.col('protein_residue') <= end_residue)
-        ).sort(['protein_residue', 'codon_position'])
+        cache_key = (gene_upper, start_residue, end_residue)
+        cached = self._range_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        lo, hi = self._residue_bounds(gene_upper, start_residue, end_residue)
+        results = self.protein_maps[gene_upper].slice(lo, hi - lo)
 
-        return results.to_dicts()
+        result_dicts = results.to_dicts()
+        self._range_cache[cache_key] = result_dicts
+        return result_dicts
+
+    def get_protein_range_df(self, gene: str, start_residue: int, end_residue: int) -> Optional[pl.DataFrame]:
+        """DataFrame form of get_protein_range, for relational joins.
+
+        Memoized like get_protein_range; treat the returned frame as
+        read-only.
+        """
+        gene_upper = gene.upper()
+        self._ensure_loaded(gene_upper)
+        if gene_upper not in self.protein_maps:
+            return None
+
+        cache_key = (gene_upper, start_residue, end_residue)
+        cached = self._range_df_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        lo, hi = self._residue_bounds(gene_upper, start_residue, end_residue)
+        results = self.protein_maps[gene_upper].slice(lo, hi - lo)
+
+        self._range_df_cache[cache_key] = results
+        return results
 
     def get_structure_metadata(self, gene: str) -> Optional[Dict]:
         """Get structure metadata for a gene."""
         return self.structure_metadata.get(gene.upper())
 
+    def get_structure_view(self, gene: str) -> Optional[StructureView]:
+        """Get the flattened structure view for a gene."""
+        return self.structure_views.get(gene.upper())
+
+    def get_plddt_array(self, gene: str) -> Optional[np.ndarray]:
+        """Get the residue-indexed pLDDT array for a gene (NaN = unknown)."""
+        return self.plddt_arrays.get(gene.upper())
+
+    @property
+    def known_genes(self) -> set:
+        """Genes with a loaded or registered protein map."""
+        return set(self.protein_maps) | set(self._map_paths)
+
+    def get_protein_map(self, gene: str) -> Optional[pl.DataFrame]:
+        """Get a gene's protein map, loading it on first access."""
+        gene_upper = gene.upper()
+        self._ensure_loaded(gene_upper)
+        return self.protein_maps.get(gene_upper)
+
     def has_gene(self, gene: str) -> bool:
-        """Check if a gene has protein mapping loaded."""
-        return gene.upper() in self.protein_maps
+        """Check if a gene has a protein mapping loaded or registered."""
+        gene_upper = gene.upper()
+        return gene_upper in self.protein_maps or gene_upper in self._map_paths
 
 
 def sanitize_float(value: Any) -> Optional[float]:
-    """Convert NaN, Inf, -Inf to None for JSON serialization."""
-    if value is None:
-        return None
-    try:
-        if math.isnan(value) or math.isinf(value):
-            return None
+    """Convert NaN, Inf, -Inf (and non-numerics) to None for JSON serialization.
+
+    A type check plus one math.isfinite call; no try/except frame on the
+    happy path.
+    """
+    if isinstance(value, (int, float, np.floating)) and math.isfinite(value):
         return float(value)
-    except (TypeError, ValueError):
-        return None
+    return None
+
+
+def sanitize_float_array(series: pl.Series) -> List[Optional[float]]:
+    """Vectorized sanitize_float for a whole Series.
+
+    One NumPy isfinite pass replaces a Python-level function call and
+    NaN/Inf check per value. Non-numeric series sanitize to all-None,
+    matching sanitize_float's behavior on unconvertible values.
+    """
+    if not series.dtype.is_numeric():
+        return [None] * len(series)
+
+    arr = series.cast(pl.Float64).to_numpy()
+    finite = np.isfinite(arr)
+    return [
+        value if ok else None
+        for value, ok in zip(arr.tolist(), finite.tolist())
+    ]
 
 
 def extract_constraint_pred(constraint_array: List, model_index: int) -> Optional[float]:
@@ -194,7 +457,7 @@ def extract_constraint_variants(variant_array: List) -> List[tuple]:
                 variants.append((allele, pred))
 
     # Sort by pred value (lowest to highest for bottom-to-top stacking)
-    variants.sort(key=lambda x: x[1])
+    variants.sort(key=itemgetter(1))
 
     return variants
 
@@ -222,7 +485,7 @@ def extract_dbnsfp_stacked_variants(variant_array: List) -> List[tuple]:
                 variants.append((allele, score, percentile))
 
     # Sort by score value (lowest to highest for bottom-to-top stacking)
-    variants.sort(key=lambda x: x[1])
+    variants.sort(key=itemgetter(1))
 
     return variants
 
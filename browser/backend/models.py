@@ -28,10 +28,14 @@ class Position(BaseModel):
 
 
 class WindowResponse(BaseModel):
-    """Response for a window query in compressed coordinates."""
+    """Response for a window query in compressed coordinates.
+
+    Positions are column-major ({column: [values]}) so the hot window path
+    can serialize Arrow columns directly without per-row dict allocation.
+    """
     filter_id: str
     window: Dict[str, Any]
-    positions: List[Dict[str, Any]]
+    positions: Dict[str, List[Any]]
     real_coordinate_ranges: List[Dict[str, Any]]
 
 
@@ -4,40 +4,54 @@ Track Tree Definitions for VarPredBrowser
 Defines the hierarchical track structure for the genome browser frontend.
 """
 
+import re
+import orjson
+from functools import lru_cache
+from sys import intern
+from types import MappingProxyType
 from typing import Dict, Any, List
 
 
+# RGC O/E field IDs formatted once at import, keyed (consequence, window),
+# with an inverse map so consumers can resolve a fieldId back to its key
+# without string parsing. Window sizes in ascending order; AF≥0 only.
+OE_WINDOWS = ("3bp", "9bp", "21bp", "45bp", "93bp")
+OE_CONSEQUENCES = (("mis", "Missense"), ("syn", "Synonymous"), ("any", "Any"))
+_OE_AF_SUFFIX = "af0epos00"
+_OE_FIELDS = {
+    (cons, window): f"rgc_{cons}_exomes_XX_XY_{window}_oe_{_OE_AF_SUFFIX}"
+    for cons, _ in OE_CONSEQUENCES
+    for window in OE_WINDOWS
+}
+_OE_FIELD_TO_KEY = {field: key for key, field in _OE_FIELDS.items()}
+
+
+def _leaf(label: str, field_id: str) -> Dict[str, Any]:
+    """Leaf track node; shared shape for the loop-built leaves."""
+    return {"label": label, "fieldId": field_id}
+
+
+def _group(label: str, children: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Internal node holding a list of child nodes."""
+    return {"label": label, "children": children}
+
+
 def build_oe_tree() -> Dict[str, Any]:
     """Build the O/E Ratios tree section - flattened by window size with Raw/%ile separation."""
-    # Window sizes in ascending order
-    windows = ["3bp", "9bp", "21bp", "45bp", "93bp"]
-    consequences = [("mis", "Missense"), ("syn", "Synonymous"), ("any", "Any")]
-    af_suffix = "af0epos00"  # Only AF≥0
 
     def build_window_section(window: str) -> Dict[str, Any]:
         raw_children = []
         perc_children = []
-        for cons, cons_label in consequences:
-            raw_children.append({
-                "label": cons_label,
-                "fieldId": f"rgc_{cons}_exomes_XX_XY_{window}_oe_{af_suffix}",
-            })
-            perc_children.append({
-                "label": cons_label,
-                "fieldId": f"rgc_{cons}_exomes_XX_XY_{window}_oe_{af_suffix}_exome_perc",
-            })
-        return {
-            "label": f"{window} O/E",
-            "children": [
-                {"label": "Raw", "children": raw_children},
-                {"label": "Exome-Wide %ile", "children": perc_children},
-            ]
-        }
+        for cons, cons_label in OE_CONSEQUENCES:
+            field_id = _OE_FIELDS[(cons, window)]
+            raw_children.append(_leaf(cons_label, field_id))
+            perc_children.append(_leaf(cons_label, f"{field_id}_exome_perc"))
+        return _group(f"{window} O/E", [
+            _group("Raw", raw_children),
+            _group("Exome-Wide %ile", perc_children),
+        ])
 
-    return {
-        "label": "O/E Ratios",
-        "children": [build_window_section(w) for w in windows],
-    }
+    return _group("O/E Ratios", [build_window_section(w) for w in OE_WINDOWS])
 
 
 def build_vir_tree() -> Dict[str, Any]:
@@ -62,52 +76,40 @@ def build_vir_tree() -> Dict[str, Any]:
         perc_children = []
         for cons, cons_label in consequences:
             for af_label, af_suffix in af_levels:
-                raw_children.append({
-                    "label": f"{cons_label} {af_label}",
-                    "fieldId": f"rgc_{cons}_exomes_XX_XY_{metric_suffix}_{af_suffix}",
-                })
+                raw_children.append(_leaf(
+                    f"{cons_label} {af_label}",
+                    f"rgc_{cons}_exomes_XX_XY_{metric_suffix}_{af_suffix}",
+                ))
                 if has_percentile:
-                    perc_children.append({
-                        "label": f"{cons_label} {af_label}",
-                        "fieldId": f"rgc_{cons}_exomes_XX_XY_{metric_suffix}_{af_suffix}_exome_perc",
-                    })
-        children = [{"label": "Raw", "children": raw_children}]
+                    perc_children.append(_leaf(
+                        f"{cons_label} {af_label}",
+                        f"rgc_{cons}_exomes_XX_XY_{metric_suffix}_{af_suffix}_exome_perc",
+                    ))
+        children = [_group("Raw", raw_children)]
         if has_percentile:
-            children.append({"label": "Exome-Wide %ile", "children": perc_children})
-        return {"label": metric_label, "children": children}
+            children.append(_group("Exome-Wide %ile", perc_children))
+        return _group(metric_label, children)
 
     # Build AA Level section (missense only) - depth has no percentiles, length does
     aa_raw_depth = []
     aa_raw_length = []
     aa_perc_length = []
     for af_label, af_suffix in af_levels:
-        aa_raw_depth.append({
-            "label": f"Depth {af_label}",
-            "fieldId": f"rgc_mis_exomes_XX_XY_aa_vir_depth_{af_suffix}",
-        })
-        aa_raw_length.append({
-            "label": f"Length {af_label}",
-            "fieldId": f"rgc_mis_exomes_XX_XY_aa_vir_length_{af_suffix}",
-        })
-        aa_perc_length.append({
-            "label": f"Length {af_label}",
-            "fieldId": f"rgc_mis_exomes_XX_XY_aa_vir_length_{af_suffix}_exome_perc",
-        })
-
-    aa_section = {
-        "label": "AA Level (Missense)",
-        "children": [
-            {"label": "Raw", "children": aa_raw_depth + aa_raw_length},
-            {"label": "Exome-Wide %ile", "children": aa_perc_length},
-        ]
-    }
+        aa_raw_depth.append(_leaf(
+            f"Depth {af_label}", f"rgc_mis_exomes_XX_XY_aa_vir_depth_{af_suffix}"))
+        aa_raw_length.append(_leaf(
+            f"Length {af_label}", f"rgc_mis_exomes_XX_XY_aa_vir_length_{af_suffix}"))
+        aa_perc_length.append(_leaf(
+            f"Length {af_label}", f"rgc_mis_exomes_XX_XY_aa_vir_length_{af_suffix}_exome_perc"))
 
-    return {
-        "label": "VIRs",
-        "children": [
-            build_metric_section(label, suffix, has_perc) for label, suffix, has_perc in metrics
-        ] + [aa_section],
-    }
+    aa_section = _group("AA Level (Missense)", [
+        _group("Raw", aa_raw_depth + aa_raw_length),
+        _group("Exome-Wide %ile", aa_perc_length),
+    ])
+
+    return _group("VIRs", [
+        build_metric_section(label, suffix, has_perc) for label, suffix, has_perc in metrics
+    ] + [aa_section])
 
 
 def build_gnomad_vir_tree() -> Dict[str, Any]:
@@ -132,18 +134,15 @@ def build_gnomad_vir_tree() -> Dict[str, Any]:
         for cons, cons_label in consequences:
             for af_label, af_suffix in af_levels:
                 # gnomAD VIR columns use format: gnomad_{cons}_XX_XY_{metric}_{af}
-                children.append({
-                    "label": f"{cons_label} {af_label}",
-                    "fieldId": f"gnomad_{cons}_XX_XY_{metric_suffix}_{af_suffix}",
-                })
-        return {"label": metric_label, "children": children}
+                children.append(_leaf(
+                    f"{cons_label} {af_label}",
+                    f"gnomad_{cons}_XX_XY_{metric_suffix}_{af_suffix}",
+                ))
+        return _group(metric_label, children)
 
-    return {
-        "label": "VIRs",
-        "children": [
-            build_metric_section(label, suffix) for label, suffix in metrics
-        ],
-    }
+    return _group("VIRs", [
+        build_metric_section(label, suffix) for label, suffix in metrics
+    ])
 
 
 def build_gnomad_cohort_tree(cohort: str, cohort_label: str) -> Dict[str, Any]:
@@ -153,26 +152,14 @@ def build_gnomad_cohort_tree(cohort: str, cohort_label: str) -> Dict[str, Any]:
 
     def build_window_section(window: str) -> Dict[str, Any]:
         """Build O/E section for a specific window size."""
-        children = []
-        for cons, cons_label in consequences:
-            children.append({
-                "label": cons_label,
-                "fieldId": f"gnomad_{cons}_{cohort}_{window}_oe",
-            })
-        return {
-            "label": f"{window} O/E",
-            "children": children,
-        }
+        return _group(f"{window} O/E", [
+            _leaf(cons_label, f"gnomad_{cons}_{cohort}_{window}_oe")
+            for cons, cons_label in consequences
+        ])
 
-    return {
-        "label": cohort_label,
-        "children": [
-            {
-                "label": "O/E Ratios",
-                "children": [build_window_section(w) for w in windows],
-            },
-        ],
-    }
+    return _group(cohort_label, [
+        _group("O/E Ratios", [build_window_section(w) for w in windows]),
+    ])
 
 
 def build_gnomad_combined_tree() -> Dict[str, Any]:
@@ -182,26 +169,14 @@ def build_gnomad_combined_tree() -> Dict[str, Any]:
 
     def build_window_section(window: str) -> Dict[str, Any]:
         """Build O/E section for a specific window size."""
-        children = []
-        for cons, cons_label in consequences:
-            children.append({
-                "label": cons_label,
-                "fieldId": f"gnomad_{cons}_combined_{window}_oe_weighted",
-            })
-        return {
-            "label": f"{window} O/E",
-            "children": children,
-        }
+        return _group(f"{window} O/E", [
+            _leaf(cons_label, f"gnomad_{cons}_combined_{window}_oe_weighted")
+            for cons, cons_label in consequences
+        ])
 
-    return {
-        "label": "gnomAD v4 Combined",
-        "children": [
-            {
-                "label": "O/E Ratios (Weighted)",
-                "children": [build_window_section(w) for w in windows],
-            },
-        ],
-    }
+    return _group("gnomAD v4 Combined", [
+        _group("O/E Ratios (Weighted)", [build_window_section(w) for w in windows]),
+    ])
 
 
 def build_coverage_tree() -> Dict[str, Any]:
@@ -209,22 +184,17 @@ def build_coverage_tree() -> Dict[str, Any]:
     thresholds = [10, 15, 20, 25, 30, 50]
 
     exome_children = [
-        {"label": f"Over {t}x", "fieldId": f"gnomad_exomes_over_{t}"}
-        for t in thresholds
+        _leaf(f"Over {t}x", f"gnomad_exomes_over_{t}") for t in thresholds
     ]
 
     genome_children = [
-        {"label": f"Over {t}x", "fieldId": f"gnomad_genomes_over_{t}"}
-        for t in thresholds
+        _leaf(f"Over {t}x", f"gnomad_genomes_over_{t}") for t in thresholds
     ]
 
-    return {
-        "label": "Coverage",
-        "children": [
-            {"label": "Exomes", "children": exome_children},
-            {"label": "Genomes", "children": genome_children},
-        ],
-    }
+    return _group("Coverage", [
+        _group("Exomes", exome_children),
+        _group("Genomes", genome_children),
+    ])
 
 
 def build_variant_frequency_tree() -> Dict[str, Any]:
@@ -240,11 +210,57 @@ def build_variant_frequency_tree() -> Dict[str, Any]:
 
 
 def build_track_tree() -> Dict[str, Any]:
-    """Build the complete track tree structure."""
-    track_tree = {
+    """Build the complete track tree structure.
+
+    Sections are assembled directly in display order, so no post-hoc
+    label searches or mid-list inserts are needed.
+    """
+    # RGC group with O/E and VIRs built inline
+    rgc_section = {
+        "label": "RGC",
+        "children": [
+            {
+                "label": "Summary",
+                "children": [
+                    {
+                        "label": "Any",
+                        "children": [
+                            {"label": "Observed", "fieldId": "rgc_any_obs_exomes_XX_XY"},
+                            {"label": "Expected μ", "fieldId": "rgc_any_prob_mu_exomes_XX_XY"},
+                        ],
+                    },
+                    {
+                        "label": "Synonymous",
+                        "children": [
+                            {"label": "Observed", "fieldId": "rgc_syn_obs_exomes_XX_XY"},
+                            {"label": "Expected μ", "fieldId": "rgc_syn_prob_mu_exomes_XX_XY"},
+                        ],
+                    },
+                    {
+                        "label": "Missense",
+                        "children": [
+                            {"label": "Observed", "fieldId": "rgc_mis_obs_exomes_XX_XY"},
+                            {"label": "Expected μ", "fieldId": "rgc_mis_prob_mu_exomes_XX_XY"},
+                        ],
+                    },
+                ],
+            },
+            build_oe_tree(),
+            build_vir_tree(),
+        ],
+    }
+
+    # gnomAD v4 sections - separate trees for Exomes, Genomes, and Combined;
+    # shared VIRs go under exomes and genomes (VIR data uses combined
+    # XX_XY, not split by cohort)
+    gnomad_exomes = build_gnomad_cohort_tree("exomes", "gnomAD v4 Exomes")
+    gnomad_genomes = build_gnomad_cohort_tree("genomes", "gnomAD v4 Genomes")
+    gnomad_exomes["children"].append(build_gnomad_vir_tree())
+    gnomad_genomes["children"].append(build_gnomad_vir_tree())
+
+    return {
         "label": "Tracks",
         "children": [
-            # 1) Counts
             {
                 "label": "Counts",
                 "children": [
@@ -253,46 +269,18 @@ def build_track_tree() -> Dict[str, Any]:
                     {"label": "Missense", "fieldId": "rgc_mis_count"},
                 ],
             },
-            # 2) RGC group
-            {
-                "label": "RGC",
-                "children": [
-                    {
-                        "label": "Summary",
-                        "children": [
-                            {
-                                "label": "Any",
-                                "children": [
-                                    {"label": "Observed", "fieldId": "rgc_any_obs_exomes_XX_XY"},
-                                    {"label": "Expected μ", "fieldId": "rgc_any_prob_mu_exomes_XX_XY"},
-                                ],
-                            },
-                            {
-                                "label": "Synonymous",
-                                "children": [
-                                    {"label": "Observed", "fieldId": "rgc_syn_obs_exomes_XX_XY"},
-                                    {"label": "Expected μ", "fieldId": "rgc_syn_prob_mu_exomes_XX_XY"},
-                                ],
-                            },
-                            {
-                                "label": "Missense",
-                                "children": [
-                                    {"label": "Observed", "fieldId": "rgc_mis_obs_exomes_XX_XY"},
-                                    {"label": "Expected μ", "fieldId": "rgc_mis_prob_mu_exomes_XX_XY"},
-                                ],
-                            },
-                        ],
-                    },
-                ],
-            },
-            # 3) ClinVar
+            rgc_section,
+            gnomad_exomes,
+            gnomad_genomes,
+            build_gnomad_combined_tree(),
+            build_coverage_tree(),
+            build_variant_frequency_tree(),
             {
                 "label": "ClinVar",
                 "children": [
                     {"label": "Variants", "fieldId": "clinvar_variants", "type": "clinvar_variants"},
                 ],
             },
-            # 4) Training Labels
             {
                 "label": "Training Labels",
                 "children": [
@@ -302,14 +290,12 @@ def build_track_tree() -> Dict[str, Any]:
                     {"label": "Unlabelled (High Qual)", "fieldId": "training.train_counts.unlabelled_high_qual"},
                 ],
             },
-            # 5) Domains
             {
                 "label": "Domains",
                 "children": [
                     {"label": "All Domains", "fieldId": "domains", "type": "domain_array"},
                 ],
             },
-            # 6) Constraint Predictions
             {
                 "label": "Constraint Predictions",
                 "children": [
@@ -318,7 +304,6 @@ def build_track_tree() -> Dict[str, Any]:
                     {"label": "Complete_1000", "fieldId": "Complete", "type": "constraint_stacked"},
                 ],
             },
-            # 7) Comparators
             {
                 "label": "Comparators",
                 "children": [
@@ -369,103 +354,94 @@ def build_track_tree() -> Dict[str, Any]:
         ],
     }
 
-    # Add O/E and VIRs under RGC
-    for child in track_tree["children"]:
-        if child["label"] == "RGC":
-            child["children"].append(build_oe_tree())
-            child["children"].append(build_vir_tree())
-            break
-
-    # Add gnomAD v4 sections - separate trees for Exomes, Genomes, and Combined
-    gnomad_exomes = build_gnomad_cohort_tree("exomes", "gnomAD v4 Exomes")
-    gnomad_genomes = build_gnomad_cohort_tree("genomes", "gnomAD v4 Genomes")
-    gnomad_combined = build_gnomad_combined_tree()
-
-    # Add shared VIRs to exomes and genomes (VIR data uses combined XX_XY, not split by cohort)
-    gnomad_exomes["children"].append(build_gnomad_vir_tree())
-    gnomad_genomes["children"].append(build_gnomad_vir_tree())
-
-    # Insert gnomAD sections after RGC (in order: Exomes, Genomes, Combined)
-    for i, child in enumerate(track_tree["children"]):
-        if child["label"] == "RGC":
-            track_tree["children"].insert(i + 1, gnomad_combined)
-            track_tree["children"].insert(i + 1, gnomad_genomes)
-            track_tree["children"].insert(i + 1, gnomad_exomes)
-            break
 
-    # Add Coverage as top-level section after gnomAD Combined
-    for i, child in enumerate(track_tree["children"]):
-        if child["label"] == "gnomAD v4 Combined":
-            track_tree["children"].insert(i + 1, build_coverage_tree())
-            break
-
-    # Add Variant Frequencies section after Coverage
-    for i, child in enumerate(track_tree["children"]):
-        if child["label"] == "Coverage":
-            track_tree["children"].insert(i + 1, build_variant_frequency_tree())
-            break
-
-    return track_tree
+# Direct track-name -> display-name mappings, frozen at import so
+# simplify_track_name never rebuilds the dict per call; the proxy makes
+# the sharing read-only
+_NAME_MAPPINGS = MappingProxyType({
+    'MTR_RGC': 'MTR',
+    'Non_Neuro_CCR_resid_pctile': 'CCR',
+    'AlphaMissense_am_pathogenicity': 'AlphaMissense',
+    'phylop_scores_447way': 'phyloP 447way',
+    'phylop_scores_100way': 'phyloP 100way',
+    'ESM1b_score': 'ESM1b',
+    'domain_name': 'Domains',
+    'domain_id_interpro': 'Domain IDs',
+    'domain_type': 'Domain Types',
+    'source_db': 'Domain Sources',
+    'domains': 'Protein Domains',
+    # ClinVar columns
+    'clinvar_variants': 'ClinVar Variants',
+    'clinvar.clinvar_count': 'ClinVar Count',
+    'clinvar.clinvar_label_list': 'ClinVar Labels',
+    'clinvar.clinvar_status_list': 'ClinVar Status',
+    'clinvar.clinvar_var_type_list': 'ClinVar Var Types',
+    # Variant frequency tracks
+    'rgc_variants': 'RGC Variants',
+    'gnomad_exomes_variants': 'gnomAD Exome Variants',
+    'gnomad_genomes_variants': 'gnomAD Genome Variants',
+    # Training columns
+    'training.train_counts.labelled': 'Labelled',
+    'training.train_counts.unlabelled': 'Unlabelled',
+    'training.train_counts.labelled_high_qual': 'Labelled (HQ)',
+    'training.train_counts.unlabelled_high_qual': 'Unlabelled (HQ)',
+    # dbNSFP columns (max aggregated values)
+    'max_AlphaMissense_am_pathogenicity': 'AlphaMissense',
+    'max_RGC_MTR_MTR': 'MTR',
+    'max_Non_Neuro_CCR_resid_pctile': 'CCR',
+    'max_ESM1b_score': 'ESM1b',
+    'max_AlphaSync_plddt': 'pLDDT',
+    'max_AlphaSync_plddt10': 'pLDDT (10)',
+    'max_AlphaSync_relasa': 'RelASA',
+    'max_AlphaSync_relasa10': 'RelASA (10)',
+    # Exome-wide percentiles
+    'AlphaMissense_am_pathogenicity_exome_perc': 'AlphaMissense (%)',
+    'ESM1b_score_exome_perc': 'ESM1b (%)',
+    'RGC_MTR_MTR_exome_perc': 'MTR (%)',
+    # Stacked tracks
+    'AlphaMissense_stacked': 'AlphaMissense (stacked)',
+    'ESM1b_stacked': 'ESM1b (stacked)',
+    # gnomAD coverage
+    'gnomad_exomes_mean': 'Exome Mean Cov',
+    'gnomad_exomes_median': 'Exome Median Cov',
+    'gnomad_exomes_over_20': 'Exome >20x',
+    'gnomad_exomes_over_30': 'Exome >30x',
+    'gnomad_genomes_mean': 'Genome Mean Cov',
+    'gnomad_genomes_median': 'Genome Median Cov',
+    'gnomad_genomes_over_20': 'Genome >20x',
+    'gnomad_genomes_over_30': 'Genome >30x',
+})
+
+
+# Single-pass prefix/infix stripping for simplify_track_name: one string
+# scan and one allocation instead of ~10 chained str.replace calls.
+# Alternation order mirrors the old replace order (underscore-wrapped
+# variants before their bare forms).
+_SIMPLIFY_MAP = {
+    'dbnsfp.max_': '',
+    'clinvar.': '',
+    'training.train_counts.': '',
+    'rgc_': '',
+    '_exomes_': '_',
+    'exomes_': '',
+    '_XX_XY_': '_',
+    'XX_XY_': '',
+    '_af0epos00': '',
+    'af0epos00': '',
+}
+_SIMPLIFY_RE = re.compile('|'.join(re.escape(token) for token in _SIMPLIFY_MAP))
 
 
+@lru_cache(maxsize=4096)
 def simplify_track_name(track_name: str) -> str:
-    """Simplify track name by removing common prefixes/terms."""
-    # Direct mappings for new annotation tracks
-    name_mappings = {
-        'MTR_RGC': 'MTR',
-        'Non_Neuro_CCR_resid_pctile': 'CCR',
-        'AlphaMissense_am_pathogenicity': 'AlphaMissense',
-        'phylop_scores_447way': 'phyloP 447way',
-        'phylop_scores_100way': 'phyloP 100way',
-        'ESM1b_score': 'ESM1b',
-        'domain_name': 'Domains',
-        'domain_id_interpro': 'Domain IDs',
-        'domain_type': 'Domain Types',
-        'source_db': 'Domain Sources',
-        'domains': 'Protein Domains',
-        # ClinVar columns
-        'clinvar_variants': 'ClinVar Variants',
-        'clinvar.clinvar_count': 'ClinVar Count',
-        'clinvar.clinvar_label_list': 'ClinVar Labels',
-        'clinvar.clinvar_status_list': 'ClinVar Status',
-        'clinvar.clinvar_var_type_list': 'ClinVar Var Types',
-        # Variant frequency tracks
-        'rgc_variants': 'RGC Variants',
-        'gnomad_exomes_variants': 'gnomAD Exome Variants',
-        'gnomad_genomes_variants': 'gnomAD Genome Variants',
-        # Training columns
-        'training.train_counts.labelled': 'Labelled',
-        'training.train_counts.unlabelled': 'Unlabelled',
-        'training.train_counts.labelled_high_qual': 'Labelled (HQ)',
-        'training.train_counts.unlabelled_high_qual': 'Unlabelled (HQ)',
-        # dbNSFP columns (max aggregated values)
-        'max_AlphaMissense_am_pathogenicity': 'AlphaMissense',
-        'max_RGC_MTR_MTR': 'MTR',
-        'max_Non_Neuro_CCR_resid_pctile': 'CCR',
-        'max_ESM1b_score': 'ESM1b',
-        'max_AlphaSync_plddt': 'pLDDT',
-        'max_AlphaSync_plddt10': 'pLDDT (10)',
-        'max_AlphaSync_relasa': 'RelASA',
-        'max_AlphaSync_relasa10': 'RelASA (10)',
-        # Exome-wide percentiles
-        'AlphaMissense_am_pathogenicity_exome_perc': 'AlphaMissense (%)',
-        'ESM1b_score_exome_perc': 'ESM1b (%)',
-        'RGC_MTR_MTR_exome_perc': 'MTR (%)',
-        # Stacked tracks
-        'AlphaMissense_stacked': 'AlphaMissense (stacked)',
-        'ESM1b_stacked': 'ESM1b (stacked)',
-        # gnomAD coverage
-        'gnomad_exomes_mean': 'Exome Mean Cov',
-        'gnomad_exomes_median': 'Exome Median Cov',
-        'gnomad_exomes_over_20': 'Exome >20x',
-        'gnomad_exomes_over_30': 'Exome >30x',
-        'gnomad_genomes_mean': 'Genome Mean Cov',
-        'gnomad_genomes_median': 'Genome Median Cov',
-        'gnomad_genomes_over_20': 'Genome >20x',
-        'gnomad_genomes_over_30': 'Genome >30x',
-    }
-    if track_name in name_mappings:
-        return name_mappings[track_name]
+    """Simplify track name by removing common prefixes/terms.
+
+    Pure string-to-string mapping, so results are memoized; repeated
+    lookups across requests cost one dict probe.
+    """
+    mapped = _NAME_MAPPINGS.get(track_name)
+    if mapped is not None:
+        return mapped
 
     # Handle gnomAD constraint O/E columns
     if track_name.startswith('gnomad_') and ('_oe' in track_name or track_name.endswith('_e')):
@@ -477,19 +453,8 @@ def simplify_track_name(track_name: str) -> str:
         base = track_name.replace('_cross_norm_perc', '')
         return f"{base.replace('_', ' ').title()} (cross-norm %)"
 
-    simplified = track_name
-
-    # Remove prefixes
-    simplified = simplified.replace('dbnsfp.max_', '')
-    simplified = simplified.replace('clinvar.', '')
-    simplified = simplified.replace('training.train_counts.', '')
-    simplified = simplified.replace('rgc_', '')
-    simplified = simplified.replace('_exomes_', '_')
-    simplified = simplified.replace('exomes_', '')
-    simplified = simplified.replace('_XX_XY_', '_')
-    simplified = simplified.replace('XX_XY_', '')
-    simplified = simplified.replace('_af0epos00', '')
-    simplified = simplified.replace('af0epos00', '')
+    # Remove prefixes/infixes in a single pass
+    simplified = _SIMPLIFY_RE.sub(lambda m: _SIMPLIFY_MAP[m.group(0)], track_name)
 
     # Handle percentile suffix
     if simplified.endswith('_exome_perc'):
@@ -500,24 +465,42 @@ def simplify_track_name(track_name: str) -> str:
     return simplified
 
 
+# Exact-name categories checked before any substring heuristics; one
+# dict probe settles the most common track names
+_CATEGORY_EXACT = {
+    'clinvar_variants': 'ClinVar',
+    'rgc_variants': 'Variant Frequencies',
+    'gnomad_exomes_variants': 'Variant Frequencies',
+    'gnomad_genomes_variants': 'Variant Frequencies',
+    'domains': 'Domains',
+}
+
+
+@lru_cache(maxsize=4096)
 def categorize_track(track_name: str) -> str:
-    """Categorize track by its name into hierarchical categories."""
-    name_lower = track_name.lower()
+    """Categorize track by its name into hierarchical categories.
+
+    Memoized like simplify_track_name; exact names resolve with one
+    dict probe and the branch chain runs once per distinct name.
+    """
+    exact = _CATEGORY_EXACT.get(track_name)
+    if exact is not None:
+        return exact
 
     # ClinVar annotations
-    if track_name.startswith('clinvar.') or track_name == 'clinvar_variants':
+    if track_name.startswith('clinvar.'):
         return 'ClinVar'
 
-    # Variant frequency tracks
-    elif track_name in ('rgc_variants', 'gnomad_exomes_variants', 'gnomad_genomes_variants'):
-        return 'Variant Frequencies'
-
     # Training labels
     elif track_name.startswith('training.'):
         return 'Training Labels'
 
+    # Lowercase only once the case-insensitive branches are reachable;
+    # the prefix hits above never pay the extra str allocation
+    name_lower = track_name.lower()
+
     # dbNSFP scores (max aggregated)
-    elif track_name.startswith('max_'):
+    if track_name.startswith('max_'):
         if 'alphasync' in name_lower:
             return 'AlphaSync'
         elif 'alphamissense' in name_lower:
@@ -611,8 +594,52 @@ def categorize_track(track_name: str) -> str:
         return 'RGC Data'
 
 
+def _intern_tree(node: Any) -> Any:
+    """Intern strings and freeze child lists in a tree node, recursively.
+
+    Labels like "Raw" or "Missense" recur across dozens of nodes (and
+    f-string-built fieldIds are never auto-interned), so sharing one
+    PyUnicodeObject per distinct string shrinks the persistent tree and
+    turns downstream key comparisons into pointer checks. Children lists
+    become tuples: smaller, no over-allocation slack, and immutable, so
+    nothing can reshape the module-level constant after import. Dicts
+    stay plain dicts because orjson will not serialize mapping proxies.
+    """
+    if isinstance(node, str):
+        return intern(node)
+    if isinstance(node, dict):
+        return {intern(key): _intern_tree(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return tuple(_intern_tree(item) for item in node)
+    return node
+
+
 # Build the track tree once at module load
-TRACK_TREE = build_track_tree()
+TRACK_TREE = _intern_tree(build_track_tree())
+
+# Serialized once at import; the track-tree endpoint serves these bytes
+# directly instead of re-encoding the same static structure per request
+TRACK_TREE_JSON: bytes = orjson.dumps(TRACK_TREE)
+
+
+def _collect_field_ids(node: Dict[str, Any], out: List[str]) -> None:
+    """Collect every fieldId in a track tree node, depth-first."""
+    field_id = node.get('fieldId')
+    if field_id:
+        out.append(field_id)
+    for child in node.get('children', ()):
+        _collect_field_ids(child, out)
+
+
+# Every fieldId the tree emits, in display order
+TRACK_FIELD_IDS: List[str] = []
+_collect_field_ids(TRACK_TREE, TRACK_FIELD_IDS)
+
+# Warm the exact-match table with each tree fieldId so known tracks
+# categorize with one dict probe; values come from the heuristics above,
+# keeping the emitted categories unchanged
+for _field_id in TRACK_FIELD_IDS:
+    _CATEGORY_EXACT.setdefault(_field_id, categorize_track(_field_id))
 
 # Available filters
 FILTERS = {
@@ -631,13 +658,13 @@ FILTERS = {
 }
 
 # Set of constraint stacked track fields that store variant arrays
-CONSTRAINT_STACKED_FIELDS = {'Constraint', 'Core', 'Complete'}
+CONSTRAINT_STACKED_FIELDS = frozenset({'Constraint', 'Core', 'Complete'})
 
 # Set of dbNSFP stacked track fields that store variant arrays (allele, score, percentile)
-DBNSFP_STACKED_FIELDS = {'AlphaMissense_stacked', 'ESM1b_stacked'}
+DBNSFP_STACKED_FIELDS = frozenset({'AlphaMissense_stacked', 'ESM1b_stacked'})
 
 # Set of variant frequency track fields
-VARIANT_FREQUENCY_FIELDS = {'rgc_variants', 'gnomad_exomes_variants', 'gnomad_genomes_variants'}
+VARIANT_FREQUENCY_FIELDS = frozenset({'rgc_variants', 'gnomad_exomes_variants', 'gnomad_genomes_variants'})
 
 # ClinVar variants field (new struct format)
 CLINVAR_VARIANTS_FIELD = 'clinvar_variants'
@@ -16,9 +16,14 @@ Usage:
 """
 
 import argparse
+import numpy as np
+import orjson
 import polars as pl
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter, Retry
+from types import MappingProxyType
 from typing import List, Dict, Tuple
 
 # Try to import from browser config, fall back to local path
@@ -35,8 +40,17 @@ DEFAULT_GENE_SYMBOL = 'SCN2A'
 DEFAULT_TRANSCRIPT_ID = 'ENST00000375437'
 DEFAULT_UNIPROT_ID = 'Q99250'
 
-# Genetic code for codon to amino acid translation
-CODON_TABLE = {
+# Shared HTTP session: keepalive avoids a fresh TCP+TLS handshake per call,
+# and transient server errors are retried with backoff
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503)),
+))
+
+# Genetic code for codon to amino acid translation (read-only)
+CODON_TABLE = MappingProxyType({
     'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L',
     'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S',
     'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*',
@@ -53,7 +67,33 @@ CODON_TABLE = {
     'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A',
     'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E',
     'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G',
-}
+})
+
+# Vectorized codon lookup: each base maps to a 2-bit code, so a codon packs
+# into a 6-bit index (0-63) into a flat amino-acid table. Bases outside ACGT
+# get a sentinel code that pushes the packed index out of range, which the
+# lookup treats as 'X' (same as the dict fallback).
+_BASE_CODE = np.full(256, 64, dtype=np.int32)
+for _i, _base in enumerate(b'ACGT'):
+    _BASE_CODE[_base] = _i
+
+_AA_CODES = np.full(64, ord('X'), dtype=np.uint8)
+for _codon, _aa in CODON_TABLE.items():
+    _idx = (_BASE_CODE[ord(_codon[0])] << 4) | (_BASE_CODE[ord(_codon[1])] << 2) | _BASE_CODE[ord(_codon[2])]
+    _AA_CODES[_idx] = ord(_aa)
+
+
+def _translate_codons(cds_sequence: str) -> np.ndarray:
+    """Translate a CDS into per-codon amino-acid byte codes (uint8).
+
+    Trailing bases that do not fill a codon are dropped; codons containing
+    non-ACGT characters translate to 'X'.
+    """
+    seq = np.frombuffer(cds_sequence.upper().encode('ascii', errors='replace'), dtype=np.uint8)
+    n_codons = seq.size // 3
+    codons = _BASE_CODE[seq[:n_codons * 3]].reshape(-1, 3)
+    packed = (codons[:, 0] << 4) | (codons[:, 1] << 2) | codons[:, 2]
+    return np.where(packed < 64, _AA_CODES[np.minimum(packed, 63)], np.uint8(ord('X'))).astype(np.uint8)
 
 
 def fetch_ensembl_exons(transcript_id: str) -> Tuple[Dict, List[Dict]]:
@@ -68,10 +108,10 @@ def fetch_ensembl_exons(transcript_id: str) -> Tuple[Dict, List[Dict]]:
     headers = {"Content-Type": "application/json"}
 
     print(f"Fetching transcript info from Ensembl: {transcript_base}")
-    response = requests.get(url, headers=headers)
+    response = _SESSION.get(url, headers=headers)
     response.raise_for_status()
 
-    data = response.json()
+    data = orjson.loads(response.content)
 
     # Get transcript details
     print(f"  Gene: {data.get('display_name', 'N/A')}")
@@ -80,10 +120,10 @@ def fetch_ensembl_exons(transcript_id: str) -> Tuple[Dict, List[Dict]]:
 
     # Fetch exons
     exon_url = f"https://rest.ensembl.org/overlap/id/{transcript_base}?feature=exon"
-    exon_response = requests.get(exon_url, headers=headers)
+    exon_response = _SESSION.get(exon_url, headers=headers)
     exon_response.raise_for_status()
 
-    exons = [e for e in exon_response.json() if e.get('Parent') == transcript_base]
+    exons = [e for e in orjson.loads(exon_response.content) if e.get('Parent') == transcript_base]
     exons.sort(key=lambda x: x['start'])
 
     return data, exons
@@ -101,7 +141,7 @@ def fetch_ensembl_cds(transcript_id: str) -> Tuple[str, List[Dict]]:
     headers = {"Content-Type": "text/plain"}
 
     print(f"Fetching CDS sequence...")
-    seq_response = requests.get(seq_url, headers=headers)
+    seq_response = _SESSION.get(seq_url, headers=headers)
     seq_response.raise_for_status()
     cds_sequence = seq_response.text.strip()
 
@@ -111,10 +151,10 @@ def fetch_ensembl_cds(transcript_id: str) -> Tuple[str, List[Dict]]:
     # Get CDS regions (genomic coordinates)
     headers = {"Content-Type": "application/json"}
     cds_url = f"https://rest.ensembl.org/overlap/id/{transcript_base}?feature=cds"
-    cds_response = requests.get(cds_url, headers=headers)
+    cds_response = _SESSION.get(cds_url, headers=headers)
     cds_response.raise_for_status()
 
-    cds_regions = [c for c in cds_response.json() if c.get('Parent') == transcript_base]
+    cds_regions = [c for c in orjson.loads(cds_response.content) if c.get('Parent') == transcript_base]
     cds_regions.sort(key=lambda x: x['start'])
 
     print(f"  CDS regions: {len(cds_regions)}")
@@ -138,55 +178,70 @@ def build_genomic_to_protein_map(
     - Determine reference amino acid
     """
 
-    mappings = []
-
-    # Build list of all CDS genomic positions in transcript order
-    cds_positions = []
+    # Build all CDS genomic positions in transcript order as columnar arrays:
+    # one arange per region (reversed within the region for minus strand),
+    # concatenated, then reversed as a whole for minus strand — the same
+    # ordering the old per-position loop produced.
+    region_positions = []
+    region_chroms = []
+    region_lengths = []
     for region in cds_regions:
-        start = region['start']
-        end = region['end']
-        positions = list(range(start, end + 1))
+        positions = np.arange(region['start'], region['end'] + 1, dtype=np.int64)
         if strand == -1:
-            positions = positions[::-1]  # Reverse for minus strand
-        cds_positions.extend([(pos, region['seq_region_name']) for pos in positions])
+            positions = positions[::-1]
+        seq_region = region['seq_region_name']
+        region_positions.append(positions)
+        region_chroms.append(f'chr{seq_region}' if not seq_region.startswith('chr') else seq_region)
+        region_lengths.append(positions.size)
+
+    if region_positions:
+        genomic_pos = np.concatenate(region_positions)
+        chroms = np.repeat(np.array(region_chroms, dtype=object), region_lengths)
+    else:
+        genomic_pos = np.empty(0, dtype=np.int64)
+        chroms = np.empty(0, dtype=object)
 
-    # For minus strand, we need to reverse the entire list
     if strand == -1:
-        cds_positions = cds_positions[::-1]
-
-    print(f"  Total CDS positions: {len(cds_positions)}")
-
-    # Map each position
-    for cds_offset, (genomic_pos, seq_region) in enumerate(cds_positions):
-        codon_position = (cds_offset % 3) + 1  # 1, 2, or 3
-        protein_residue = (cds_offset // 3) + 1  # 1-based
-
-        # Get the codon for this position
-        codon_start = (cds_offset // 3) * 3
-        if codon_start + 3 <= len(cds_sequence):
-            codon = cds_sequence[codon_start:codon_start + 3]
-            ref_aa = CODON_TABLE.get(codon.upper(), 'X')
-        else:
-            ref_aa = 'X'
-
-        mappings.append({
-            'chrom': f'chr{seq_region}' if not seq_region.startswith('chr') else seq_region,
-            'pos': genomic_pos,
-            'cds_offset': cds_offset,
-            'codon_position': codon_position,
-            'protein_residue': protein_residue,
-            'ref_aa': ref_aa,
-            'strand': '+' if strand == 1 else '-'
-        })
-
-    df = pl.DataFrame(mappings)
+        genomic_pos = genomic_pos[::-1]
+        chroms = chroms[::-1]
+
+    n = genomic_pos.size
+    print(f"  Total CDS positions: {n}")
+
+    cds_offset = np.arange(n, dtype=np.int64)
+    codon_position = (cds_offset % 3) + 1  # 1, 2, or 3
+    protein_residue = (cds_offset // 3) + 1  # 1-based
+
+    # Translate each codon once, then gather per position; positions past the
+    # last complete codon get 'X' like the old bounds check.
+    aa_codes = _translate_codons(cds_sequence)
+    residue_idx = cds_offset // 3
+    if aa_codes.size:
+        ref_aa_codes = np.where(
+            residue_idx < aa_codes.size,
+            aa_codes[np.minimum(residue_idx, aa_codes.size - 1)],
+            np.uint8(ord('X'))
+        ).astype(np.uint8)
+    else:
+        ref_aa_codes = np.full(n, ord('X'), dtype=np.uint8)
+    ref_aa = ref_aa_codes.view('S1').astype('U1')
+
+    df = pl.DataFrame({
+        'chrom': pl.Series('chrom', chroms, dtype=pl.Utf8),
+        'pos': genomic_pos,
+        'cds_offset': cds_offset,
+        'codon_position': codon_position,
+        'protein_residue': protein_residue,
+        'ref_aa': pl.Series('ref_aa', ref_aa),
+        'strand': np.repeat(np.array(['+' if strand == 1 else '-'], dtype=object), n),
+    })
     return df
 
 
 def fetch_uniprot_sequence(uniprot_id: str) -> str:
     """Fetch protein sequence from UniProt."""
     url = f"https://rest.uniprot.org/uniprotkb/{uniprot_id}.fasta"
-    response = requests.get(url)
+    response = _SESSION.get(url)
     response.raise_for_status()
 
     # Parse FASTA
@@ -203,41 +258,45 @@ def main(gene_symbol: str, transcript_id: str, uniprot_id: str):
     # Create data directory if needed
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Fetch transcript info from Ensembl
-    print("\n[Step 1] Fetching transcript information from Ensembl...")
-    transcript_info, exons = fetch_ensembl_exons(transcript_id)
+    # The Ensembl transcript/CDS lookups and the UniProt fetch share no
+    # dependencies, so run them concurrently over the keepalive session
+    # (progress lines from the fetchers may interleave)
+    print("\n[Step 1] Fetching Ensembl transcript, CDS, and UniProt data...")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        exons_future = pool.submit(fetch_ensembl_exons, transcript_id)
+        cds_future = pool.submit(fetch_ensembl_cds, transcript_id)
+        uniprot_future = pool.submit(fetch_uniprot_sequence, uniprot_id)
+        transcript_info, exons = exons_future.result()
+        cds_sequence, cds_regions = cds_future.result()
+        uniprot_seq = uniprot_future.result()
+
     strand = transcript_info.get('strand', 1)
     chrom = transcript_info.get('seq_region_name', '2')
 
-    # Fetch CDS
-    print("\n[Step 2] Fetching CDS sequence and regions...")
-    cds_sequence, cds_regions = fetch_ensembl_cds(transcript_id)
-
     # Verify against UniProt
-    print("\n[Step 3] Verifying against UniProt sequence...")
-    uniprot_seq = fetch_uniprot_sequence(uniprot_id)
+    print("\n[Step 2] Verifying against UniProt sequence...")
     print(f"  UniProt sequence length: {len(uniprot_seq)} aa")
 
-    # Translate CDS and compare
-    translated = ''
-    for i in range(0, len(cds_sequence) - 2, 3):
-        codon = cds_sequence[i:i+3].upper()
-        aa = CODON_TABLE.get(codon, 'X')
-        if aa == '*':
-            break
-        translated += aa
+    # Translate CDS and compare (stop at the first stop codon)
+    aa_codes = _translate_codons(cds_sequence)
+    stop_mask = aa_codes == ord('*')
+    stop = int(np.argmax(stop_mask)) if stop_mask.any() else aa_codes.size
+    translated = aa_codes[:stop].tobytes().decode('ascii')
 
     print(f"  Translated CDS length: {len(translated)} aa")
 
     if translated == uniprot_seq:
         print("  Sequences match!")
     else:
-        # Check for minor differences
-        matches = sum(1 for a, b in zip(translated, uniprot_seq) if a == b)
-        print(f"  Warning: Sequences differ: {matches}/{min(len(translated), len(uniprot_seq))} positions match")
+        # Check for minor differences (vectorized over the overlapping prefix)
+        overlap = min(len(translated), len(uniprot_seq))
+        matches = int(np.sum(
+            aa_codes[:overlap] == np.frombuffer(uniprot_seq[:overlap].encode('ascii', errors='replace'), dtype=np.uint8)
+        ))
+        print(f"  Warning: Sequences differ: {matches}/{overlap} positions match")
 
     # Build mapping
-    print("\n[Step 4] Building genomic-to-protein mapping...")
+    print("\n[Step 3] Building genomic-to-protein mapping...")
     mapping_df = build_genomic_to_protein_map(cds_sequence, cds_regions, strand, chrom)
 
     # Add gene symbol and transcript info
@@ -247,9 +306,25 @@ def main(gene_symbol: str, transcript_id: str, uniprot_id: str):
         pl.lit(uniprot_id).alias('uniprot_accession')
     ])
 
+    # Shrink low-cardinality strings to dictionary-encoded categoricals and
+    # integer columns to the narrowest width that fits; the backend decodes
+    # categoricals back to Utf8 at registration (CoordinateMapper
+    # .register_protein_map), so its join keys stay plain strings
+    mapping_df = mapping_df.with_columns([
+        pl.col('chrom').cast(pl.Categorical),
+        pl.col('ref_aa').cast(pl.Categorical),
+        pl.col('strand').cast(pl.Categorical),
+        pl.col('gene_symbol').cast(pl.Categorical),
+        pl.col('transcript_id').cast(pl.Categorical),
+        pl.col('uniprot_accession').cast(pl.Categorical),
+        pl.col('cds_offset').cast(pl.UInt32),
+        pl.col('codon_position').cast(pl.UInt8),
+        pl.col('protein_residue').cast(pl.UInt32),
+    ])
+
     # Save
     output_path = DATA_DIR / f'{gene_symbol.lower()}_protein_map.parquet'
-    mapping_df.write_parquet(output_path)
+    mapping_df.write_parquet(output_path, compression='zstd', compression_level=3, statistics=True)
     print(f"\nSaved mapping to: {output_path}")
     print(f"  Total positions: {len(mapping_df)}")
     print(f"  Protein residues: {mapping_df['protein_residue'].max()}")
@@ -13,7 +13,10 @@ Usage:
 """
 
 import argparse
+import json
+import numpy as np
 import polars as pl
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -74,23 +77,72 @@ def get_vir_columns() -> dict:
     return columns
 
 
-def build_percentile_exprs(df: pl.DataFrame, columns: dict[str, str]) -> list[pl.Expr]:
+# Input-independent column maps, built once at import
+OE_COLUMNS = get_oe_columns()
+VIR_COLUMNS = get_vir_columns()
+
+# Quantile grid for the cutpoints sidecar: one cut per whole percentile
+_CUT_QUANTILES = np.linspace(0, 1, 101)
+
+
+def percentile_from_cuts(value: float, cuts: list) -> int:
+    """Bin a raw score into a whole percentile using precomputed cutpoints."""
+    return int(min(np.searchsorted(cuts, value), 100))
+
+
+def write_cutpoints_sidecar(df: pl.DataFrame, columns: dict, output_path: str) -> None:
+    """
+    Write per-column percentile cutpoints next to the output parquet.
+
+    The sidecar holds 101 quantile cuts (0-100%) per score column, so a
+    consumer can bin any raw value to a whole percentile with one
+    searchsorted instead of re-ranking the full dataset.
+    """
+    df_columns = set(df.columns)
+    cutpoints = {}
+    for col in columns:
+        if col not in df_columns:
+            continue
+        values = df[col].drop_nulls().to_numpy()
+        if values.size:
+            cutpoints[col] = np.quantile(values, _CUT_QUANTILES).tolist()
+
+    cuts_path = Path(output_path).with_suffix('.cutpoints.json')
+    with open(cuts_path, 'w') as f:
+        json.dump(cutpoints, f)
+    print(f"  Wrote cutpoints for {len(cutpoints)} columns to {cuts_path}")
+
+
+def build_percentile_exprs(
+    df: pl.DataFrame,
+    columns: dict[str, str],
+    rank_method: str = 'average'
+) -> list[pl.Expr]:
     """
     Build percentile expressions for all columns at once.
 
+    rank_method 'average' gives tie-averaged percentiles; 'max' gives the
+    cheaper nearest-rank percentile (share of values <= v, no tie pass).
+
     Returns list of expressions that can be passed to with_columns().
     """
-    exprs = []
-    for col, name in columns.items():
-        if col in df.columns:
-            # Count non-null values for this column
-            non_null_count = df.select(pl.col(col).is_not_null().sum()).item()
-            if non_null_count > 0:
-                exprs.append(
-                    (pl.col(col).rank(method='average') / non_null_count * 100)
-                    .alias(f'{name}_exome_perc')
-                )
-    return exprs
+    df_columns = set(df.columns)
+
+    # The non-null count lives inside the expression, so rank and count are
+    # evaluated together in one plan with no Python-side materialization;
+    # all-null columns rank to null, which makes a separate zero guard
+    # unnecessary
+    # Percentiles carry at most ~2 meaningful decimals, so float32 is
+    # lossless for display while halving the on-disk footprint; the rank
+    # math itself stays in float64 and is only cast on output
+    return [
+        (pl.col(col).rank(method=rank_method)
+         / pl.col(col).is_not_null().sum() * 100)
+        .cast(pl.Float32)
+        .alias(f'{columns[col]}_exome_perc')
+        for col in columns
+        if col in df_columns
+    ]
 
 
 def build_max_pred_exprs(df: pl.DataFrame, columns: dict[str, tuple]) -> list[pl.Expr]:
@@ -103,9 +155,10 @@ def build_max_pred_exprs(df: pl.DataFrame, columns: dict[str, tuple]) -> list[pl
 
     Array format: [{alt: str, <score_field>: float, ...}, ...]
     """
+    df_columns = set(df.columns)
     exprs = []
     for col, (score_field, _) in columns.items():
-        if col in df.columns:
+        if col in df_columns:
             exprs.append(
                 pl.col(col).list.eval(pl.element().struct.field(score_field)).list.max()
                 .alias(f'{col}_max_pred')
@@ -113,73 +166,63 @@ def build_max_pred_exprs(df: pl.DataFrame, columns: dict[str, tuple]) -> list[pl
     return exprs
 
 
-def add_per_variant_percentiles(
+def explode_stacked_scores(
     df: pl.DataFrame,
     stacked_col: str,
     score_field: str,
     extra_fields: list[str]
 ) -> pl.DataFrame:
     """
-    Add percentile field to each variant in a stacked array column.
-
-    Args:
-        df: Input DataFrame
-        stacked_col: Name of the stacked array column
-        score_field: Name of the score field to percentile ('pred' or 'score')
-        extra_fields: List of additional fields to preserve (e.g., ['n_pred'])
+    Explode a stacked array column once into long form (one row per variant).
 
-    Input format: [{alt: str, <score_field>: float, ...}, ...]
-    Output format: [{alt: str, <score_field>: float, ..., percentile: float}, ...]
-
-    Percentiles are calculated across ALL variants at ALL positions.
+    Returns a frame with _row_idx, _variant, _alt, _score, and one _<field>
+    column per extra field. Null list rows explode to a single null-variant
+    row so the fold-back can still see them; callers filter as needed.
     """
-    if stacked_col not in df.columns:
-        return df
-
-    print(f"    Processing {stacked_col} (score_field={score_field})...")
-
-    # Add row index for grouping back
-    df = df.with_row_index('_row_idx')
-
-    # Explode the array to get individual variants
-    # Note: explode() must be called on DataFrame, not inside select()
-    exploded = df.select(
-        '_row_idx',
-        pl.col(stacked_col).alias('_variant')
-    ).explode('_variant').filter(
-        pl.col('_variant').is_not_null()
-    )
-
-    if exploded.height == 0:
-        print(f"      No variants found in {stacked_col}")
-        df = df.drop('_row_idx')
-        return df
-
-    # Extract score values - always extract 'alt' and the score field
     extract_exprs = [
         pl.col('_variant').struct.field('alt').alias('_alt'),
         pl.col('_variant').struct.field(score_field).alias('_score'),
     ]
-    # Also extract any extra fields
     for field in extra_fields:
         extract_exprs.append(
             pl.col('_variant').struct.field(field).alias(f'_{field}')
         )
-    exploded = exploded.with_columns(extract_exprs)
+    return df.select(
+        '_row_idx',
+        pl.col(stacked_col).alias('_variant')
+    ).explode('_variant').with_columns(extract_exprs)
 
-    # Count non-null scores
-    total_variants = exploded.filter(pl.col('_score').is_not_null()).height
-    print(f"      Total variants: {total_variants:,}")
 
-    if total_variants > 0:
-        # Calculate percentile rank
-        exploded = exploded.with_columns(
-            (pl.col('_score').rank(method='average') / total_variants * 100)
-            .alias('_percentile')
-        )
+def fold_back_stacked(
+    df: pl.DataFrame,
+    stacked_col: str,
+    long: pl.DataFrame,
+    score_field: str,
+    extra_fields: list[str],
+    cross_norm_col: str = None
+) -> pl.DataFrame:
+    """
+    Rebuild a stacked array column from its long form and replace it in df.
 
-        # Rebuild struct with percentile field
-        # Build the struct fields dynamically
+    Structs carry alt, the score field, any extra fields, and percentile.
+    When cross_norm_col is given, a cross_norm_perc field is appended and
+    null-variant rows fold back as all-null structs (matching the previous
+    two-pass rebuild); without it, null list rows stay null lists.
+    """
+    if cross_norm_col is None:
+        # Append percentile to the existing structs in place; with_fields
+        # leaves null structs null, which is exactly the filtered semantics
+        # of this path
+        rebuilt = long.filter(
+            pl.col('_variant').is_not_null()
+        ).with_columns(
+            pl.col('_variant').struct.with_fields(
+                percentile=pl.col('_percentile')
+            ).alias('_new_variant')
+        )
+    else:
+        # Full rebuild from the extracted columns: null-variant rows must
+        # fold back as structs of nulls here, which with_fields would drop
         struct_fields = [
             pl.col('_alt').alias('alt'),
             pl.col('_score').alias(score_field),
@@ -187,25 +230,19 @@ def add_per_variant_percentiles(
         for field in extra_fields:
             struct_fields.append(pl.col(f'_{field}').alias(field))
         struct_fields.append(pl.col('_percentile').alias('percentile'))
-
-        exploded = exploded.with_columns(
-            pl.struct(struct_fields).alias('_variant_with_perc')
-        )
-
-        # Group back by row index to recreate arrays
-        grouped = exploded.group_by('_row_idx').agg(
-            pl.col('_variant_with_perc').alias(f'{stacked_col}_with_perc')
+        struct_fields.append(pl.col(cross_norm_col).alias('cross_norm_perc'))
+        rebuilt = long.with_columns(
+            pl.struct(struct_fields).alias('_new_variant')
         )
+    grouped = rebuilt.filter(
+        pl.col('_new_variant').is_not_null()
+    ).group_by('_row_idx').agg(
+        pl.col('_new_variant').alias(f'{stacked_col}_rebuilt')
+    )
 
-        # Join back to original dataframe
-        df = df.join(grouped, on='_row_idx', how='left')
-
-        # Replace original column with new one containing percentiles
-        df = df.drop(stacked_col)
-        df = df.rename({f'{stacked_col}_with_perc': stacked_col})
-
-    df = df.drop('_row_idx')
-    return df
+    df = df.join(grouped, on='_row_idx', how='left')
+    df = df.drop(stacked_col)
+    return df.rename({f'{stacked_col}_rebuilt': stacked_col})
 
 
 # Stacked columns for cross-normalization (must have per-variant scores)
@@ -223,83 +260,140 @@ CROSS_NORM_STACKED_COLUMNS = {
 MTR_GATING_COLUMN = 'max_RGC_MTR_MTR'
 
 
-def add_cross_norm_percentiles(df: pl.DataFrame) -> pl.DataFrame:
+def process_stacked_columns(df: pl.DataFrame) -> pl.DataFrame:
     """
-    Add cross-normalized percentile to variants where ALL 5 scores are defined
-    AND MTR is available at that position.
-
-    Cross-normalization means: for each variant (position + alt allele),
-    calculate percentile only among variants that have all 5 scores.
+    Add per-variant percentiles and cross-normalized percentiles to the
+    stacked array columns in one fused pass.
+
+    Each stacked column is exploded exactly once; the resulting long frame
+    is reused for the per-variant percentile rank, the MTR-gated cross-norm
+    join, and the final struct rebuild (the old implementation exploded
+    every column three times).
+
+    Per-variant percentiles are calculated across ALL variants at ALL
+    positions. Cross-normalization adds cross_norm_perc to variants where
+    MTR is defined at the position (gating filter) and ALL stacked
+    predictor scores exist for the (position, alt) pair; MTR itself gets a
+    position-level cross-norm percentile among those positions.
+    """
+    print("\n=== Calculating Per-Variant Percentiles for Stacked Arrays ===")
 
-    MTR gating: Sites without MTR are excluded from cross-normalization entirely.
-    This ensures consistency - if a site isn't in MTR, it won't have cross-norm
-    percentiles for any of the other metrics either.
+    df = df.with_row_index('_row_idx')
+    df_columns = set(df.columns)
+
+    # Explode each stacked column once and attach the per-variant
+    # percentile. The columns are independent until the fold-back, and
+    # Polars releases the GIL, so the explode/count/rank work runs in
+    # threads; results are gathered in definition order to keep the log
+    # and downstream processing deterministic.
+    present = [
+        (stacked_col, score_field, extra_fields)
+        for stacked_col, (score_field, extra_fields) in STACKED_PRED_COLUMNS.items()
+        if stacked_col in df_columns
+    ]
 
-    This modifies the stacked arrays to add a 'cross_norm_perc' field.
-    """
+    def _explode_and_rank(item):
+        stacked_col, score_field, extra_fields = item
+        long = explode_stacked_scores(df, stacked_col, score_field, extra_fields)
+        n_variants, total_variants = long.select(
+            pl.col('_variant').is_not_null().sum(),
+            pl.col('_score').is_not_null().sum(),
+        ).row(0)
+        if n_variants == 0 or total_variants == 0:
+            return stacked_col, score_field, n_variants, total_variants, None
+        long = long.with_columns(
+            (pl.col('_score').rank(method='average') / total_variants * 100)
+            .cast(pl.Float32)
+            .alias('_percentile')
+        )
+        return stacked_col, score_field, n_variants, total_variants, long
+
+    longs = {}
+    if present:
+        with ThreadPoolExecutor(max_workers=len(present)) as pool:
+            for stacked_col, score_field, n_variants, total_variants, long in pool.map(
+                _explode_and_rank, present
+            ):
+                print(f"    Processing {stacked_col} (score_field={score_field})...")
+                if n_variants == 0:
+                    print(f"      No variants found in {stacked_col}")
+                    continue
+                print(f"      Total variants: {total_variants:,}")
+                if long is not None:
+                    longs[stacked_col] = long
+
+    def fold_back_all(cross_norm_lookup=None):
+        """Rebuild every exploded column, with cross-norm fields if given."""
+        result = df
+        for col, (score_field, extra_fields) in STACKED_PRED_COLUMNS.items():
+            if col not in longs:
+                continue
+            cross_norm_col = None
+            if cross_norm_lookup is not None:
+                name = CROSS_NORM_STACKED_COLUMNS.get(col, (None, None))[1]
+                perc_col = f'{name}_cross_norm_perc' if name else None
+                if perc_col is not None and perc_col in cross_norm_lookup.columns:
+                    long = longs[col].join(
+                        cross_norm_lookup.select('_row_idx', 'alt', perc_col),
+                        left_on=['_row_idx', '_alt'],
+                        right_on=['_row_idx', 'alt'],
+                        how='left'
+                    )
+                    result = fold_back_stacked(result, col, long, score_field, extra_fields, perc_col)
+                    continue
+            result = fold_back_stacked(result, col, longs[col], score_field, extra_fields, cross_norm_col)
+        return result
+
+    # --- Cross-normalization over the shared long frames ---
     print("\n=== Calculating Per-Variant Cross-Normalized Percentiles ===")
 
-    # Check MTR gating column
-    if MTR_GATING_COLUMN not in df.columns:
+    if MTR_GATING_COLUMN not in df_columns:
         print(f"  WARNING: MTR gating column '{MTR_GATING_COLUMN}' not found, skipping cross-norm")
-        return df
+        return fold_back_all().drop('_row_idx')
 
-    mtr_defined_count = df.filter(pl.col(MTR_GATING_COLUMN).is_not_null()).height
+    mtr_defined_count = df.select(pl.col(MTR_GATING_COLUMN).is_not_null().sum()).item()
     print(f"  MTR gating: {mtr_defined_count:,} / {len(df):,} positions have MTR defined")
 
-    # Check which stacked columns exist
-    available_cols = {k: v for k, v in CROSS_NORM_STACKED_COLUMNS.items() if k in df.columns}
+    available_cols = {k: v for k, v in CROSS_NORM_STACKED_COLUMNS.items() if k in longs}
     print(f"  Available stacked columns: {list(available_cols.keys())}")
 
     if len(available_cols) < 2:
         print("  Not enough stacked columns for cross-normalization, skipping")
-        return df
-
-    # Add row index for tracking
-    df = df.with_row_index('_row_idx')
+        return fold_back_all().drop('_row_idx')
 
-    # Get row indices where MTR is defined (for filtering)
+    # Per-name score tables reuse the long frames (no re-explode), keeping
+    # only real variants at MTR-valid positions
     mtr_valid_rows = df.filter(
         pl.col(MTR_GATING_COLUMN).is_not_null()
     ).select('_row_idx')
 
-    # Explode each stacked column and extract scores (only for MTR-valid positions)
-    exploded_dfs = {}
+    score_tables = {}
     for col, (score_field, name) in available_cols.items():
-        print(f"  Exploding {col} (MTR-gated)...")
-        exploded = df.select(
-            '_row_idx',
-            pl.col(col).alias('_variant')
-        ).explode('_variant').filter(
+        table = longs[col].filter(
             pl.col('_variant').is_not_null()
         ).join(
             mtr_valid_rows, on='_row_idx', how='inner'  # Only keep MTR-valid positions
         )
-
-        if exploded.height == 0:
+        if table.height == 0:
             print(f"    No variants in {col}")
             continue
+        score_tables[name] = table.select(
+            '_row_idx',
+            pl.col('_alt').alias('alt'),
+            pl.col('_score').alias(f'{name}_score'),
+        )
 
-        # Extract alt and score
-        exploded = exploded.with_columns([
-            pl.col('_variant').struct.field('alt').alias('alt'),
-            pl.col('_variant').struct.field(score_field).alias(f'{name}_score'),
-        ])
-
-        exploded_dfs[name] = exploded.select('_row_idx', 'alt', f'{name}_score')
-
-    if len(exploded_dfs) < 2:
+    if len(score_tables) < 2:
         print("  Not enough valid stacked columns, skipping cross-norm")
-        df = df.drop('_row_idx')
-        return df
+        return fold_back_all().drop('_row_idx')
 
-    # Join all exploded dataframes on (row_idx, alt)
-    print(f"  Joining {len(exploded_dfs)} score tables by (row_idx, alt)...")
-    names = list(exploded_dfs.keys())
-    joined = exploded_dfs[names[0]]
+    # Join all score tables on (row_idx, alt)
+    print(f"  Joining {len(score_tables)} score tables by (row_idx, alt)...")
+    names = list(score_tables.keys())
+    joined = score_tables[names[0]]
     for name in names[1:]:
         joined = joined.join(
-            exploded_dfs[name],
+            score_tables[name],
             on=['_row_idx', 'alt'],
             how='inner'  # Only keep variants with ALL scores
         )
@@ -308,82 +402,25 @@ def add_cross_norm_percentiles(df: pl.DataFrame) -> pl.DataFrame:
 
     if joined.height == 0:
         print("  No variants have all scores defined, skipping cross-norm")
-        df = df.drop('_row_idx')
-        return df
+        return fold_back_all().drop('_row_idx')
 
     # Calculate cross-norm percentile for each score
     cross_norm_count = joined.height
-    for name in names:
-        score_col = f'{name}_score'
-        perc_col = f'{name}_cross_norm_perc'
-        joined = joined.with_columns(
-            (pl.col(score_col).rank(method='average') / cross_norm_count * 100)
-            .alias(perc_col)
-        )
+    joined = joined.with_columns([
+        (pl.col(f'{name}_score').rank(method='average') / cross_norm_count * 100)
+        .cast(pl.Float32)
+        .alias(f'{name}_cross_norm_perc')
+        for name in names
+    ])
     print(f"  Calculated cross-norm percentiles for {len(names)} scores")
 
-    # Now we need to add cross_norm_perc back to each stacked array
-    # Create a lookup table: (row_idx, alt) -> cross_norm_perc for each score
+    # Lookup table: (row_idx, alt) -> cross_norm_perc for each score
     cross_norm_lookup = joined.select(
         '_row_idx', 'alt',
         *[f'{name}_cross_norm_perc' for name in names]
     )
 
-    # For each stacked column, update the structs to include cross_norm_perc
-    for col, (score_field, name) in available_cols.items():
-        perc_col = f'{name}_cross_norm_perc'
-        if perc_col not in cross_norm_lookup.columns:
-            continue
-
-        print(f"  Adding cross_norm_perc to {col}...")
-
-        # Explode the array again to add cross_norm_perc
-        exploded = df.select(
-            '_row_idx',
-            pl.col(col).alias('_variant')
-        ).explode('_variant')
-
-        # Add sequence number within each group to maintain order
-        exploded = exploded.with_columns(
-            pl.col('_variant').struct.field('alt').alias('_alt')
-        )
-
-        # Join with cross_norm_lookup
-        exploded = exploded.join(
-            cross_norm_lookup.select('_row_idx', 'alt', perc_col),
-            left_on=['_row_idx', '_alt'],
-            right_on=['_row_idx', 'alt'],
-            how='left'
-        )
-
-        # Rebuild struct with cross_norm_perc field
-        # Use STACKED_PRED_COLUMNS to get the correct field structure
-        pred_score_field, extra_fields = STACKED_PRED_COLUMNS.get(col, (score_field, []))
-
-        struct_fields = [
-            pl.col('_variant').struct.field('alt').alias('alt'),
-            pl.col('_variant').struct.field(pred_score_field).alias(pred_score_field),
-        ]
-        for field in extra_fields:
-            struct_fields.append(pl.col('_variant').struct.field(field).alias(field))
-        struct_fields.append(pl.col('_variant').struct.field('percentile').alias('percentile'))
-        struct_fields.append(pl.col(perc_col).alias('cross_norm_perc'))
-
-        exploded = exploded.with_columns(
-            pl.struct(struct_fields).alias('_new_variant')
-        )
-
-        # Filter out nulls and group back
-        grouped = exploded.filter(
-            pl.col('_new_variant').is_not_null()
-        ).group_by('_row_idx').agg(
-            pl.col('_new_variant').alias(f'{col}_with_xnorm')
-        )
-
-        # Join back and replace column
-        df = df.join(grouped, on='_row_idx', how='left')
-        df = df.drop(col)
-        df = df.rename({f'{col}_with_xnorm': col})
+    df_rebuilt = fold_back_all(cross_norm_lookup)
 
     # Calculate MTR cross-norm percentile (position-level)
     # MTR percentile is calculated only among positions with all 5 predictor scores
@@ -392,75 +429,79 @@ def add_cross_norm_percentiles(df: pl.DataFrame) -> pl.DataFrame:
     cross_norm_position_count = cross_norm_positions.height
     print(f"    Cross-norm positions for MTR: {cross_norm_position_count:,}")
 
-    # Calculate MTR percentile among these positions
-    mtr_at_cross_norm = df.join(
+    mtr_at_cross_norm = df_rebuilt.join(
         cross_norm_positions, on='_row_idx', how='inner'
     ).select('_row_idx', MTR_GATING_COLUMN)
 
     mtr_with_perc = mtr_at_cross_norm.with_columns(
         (pl.col(MTR_GATING_COLUMN).rank(method='average') / cross_norm_position_count * 100)
+        .cast(pl.Float32)
         .alias('_mtr_cross_norm_perc')
     ).select('_row_idx', '_mtr_cross_norm_perc')
 
-    # Join back to main dataframe
-    df = df.join(mtr_with_perc, on='_row_idx', how='left')
-    df = df.rename({'_mtr_cross_norm_perc': 'RGC_MTR_MTR_cross_norm_perc'})
+    df_rebuilt = df_rebuilt.join(mtr_with_perc, on='_row_idx', how='left')
+    df_rebuilt = df_rebuilt.rename({'_mtr_cross_norm_perc': 'RGC_MTR_MTR_cross_norm_perc'})
 
-    df = df.drop('_row_idx')
     print(f"  Cross-normalization complete (including MTR)")
-    return df
+    return df_rebuilt.drop('_row_idx')
 
 
-def main(input_path: str, output_path: str):
+def main(input_path: str, output_path: str, percentile_method: str = 'average'):
     print(f"Loading data from {input_path}...")
-    df = pl.read_parquet(input_path)
-    print(f"Loaded {len(df):,} rows, {len(df.columns)} columns")
+    lf = pl.scan_parquet(input_path)
+    schema_columns = set(lf.collect_schema().names())
 
     # Collect all column mappings
     all_columns = {}
     all_columns.update(SCORE_COLUMNS)
-    all_columns.update(get_oe_columns())
-    all_columns.update(get_vir_columns())
+    all_columns.update(OE_COLUMNS)
+    all_columns.update(VIR_COLUMNS)
 
-    # Report which columns are available
-    available = [col for col in all_columns if col in df.columns]
-    missing = [col for col in all_columns if col not in df.columns]
+    # Report which columns are available (from the parquet schema, before
+    # any data is read)
+    available = [col for col in all_columns if col in schema_columns]
+    missing = [col for col in all_columns if col not in schema_columns]
     print(f"\n=== Column Availability ===")
     print(f"  Available: {len(available)}/{len(all_columns)}")
     if missing:
         print(f"  Missing: {missing[:5]}{'...' if len(missing) > 5 else ''}")
 
+    # The per-variant passes below need explode/join/count control flow, so
+    # materialize once here via the streaming engine rather than holding the
+    # whole plan lazy
+    df = lf.collect(engine='streaming')
+    print(f"Loaded {len(df):,} rows, {len(df.columns)} columns")
+
     # --- EXTRACT MAX PREDICTIONS FROM STACKED ARRAYS ---
     print("\n=== Extracting Max Predictions from Stacked Arrays ===")
-    available_stacked = [col for col in STACKED_PRED_COLUMNS if col in df.columns]
+    df_columns = set(df.columns)
+    available_stacked = [col for col in STACKED_PRED_COLUMNS if col in df_columns]
     print(f"  Stacked columns: {available_stacked}")
 
     max_pred_exprs = build_max_pred_exprs(df, STACKED_PRED_COLUMNS)
     if max_pred_exprs:
         df = df.with_columns(max_pred_exprs)
+        df_columns = set(df.columns)
         print(f"  Extracted {len(max_pred_exprs)} max_pred columns in parallel")
 
     # Add max_pred columns to percentile calculation
     for col in STACKED_PRED_COLUMNS:
         max_col = f'{col}_max_pred'
-        if max_col in df.columns:
+        if max_col in df_columns:
             all_columns[max_col] = col
 
-    # --- PER-VARIANT PERCENTILES FOR STACKED ARRAYS ---
-    print("\n=== Calculating Per-Variant Percentiles for Stacked Arrays ===")
-    for stacked_col, (score_field, extra_fields) in STACKED_PRED_COLUMNS.items():
-        df = add_per_variant_percentiles(df, stacked_col, score_field, extra_fields)
-
-    # --- PER-VARIANT CROSS-NORMALIZED PERCENTILES ---
-    # This adds cross_norm_perc to variants where:
+    # --- PER-VARIANT AND CROSS-NORMALIZED PERCENTILES ---
+    # One fused pass: each stacked column is exploded once and reused for
+    # per-variant percentiles plus cross_norm_perc on variants where:
     # 1. MTR is defined at the position (gating filter)
     # 2. ALL 5 stacked predictor scores exist (Constraint, Core, Complete, AlphaMissense, ESM1b)
     # Also calculates MTR cross-norm percentile among positions meeting these criteria
-    df = add_cross_norm_percentiles(df)
+    df = process_stacked_columns(df)
 
     # --- EXOME-WIDE PERCENTILES (ALL AT ONCE) ---
     print("\n=== Calculating Exome-Wide Percentiles (Parallel) ===")
-    percentile_exprs = build_percentile_exprs(df, all_columns)
+    rank_method = 'average' if percentile_method == 'average' else 'max'
+    percentile_exprs = build_percentile_exprs(df, all_columns, rank_method)
     print(f"  Building {len(percentile_exprs)} percentile expressions...")
 
     if percentile_exprs:
@@ -481,30 +522,33 @@ def main(input_path: str, output_path: str):
     ]
 
     # Check which columns exist
-    available_scores = [(col, name) for col, name in cross_norm_scores if col in df.columns]
+    df_columns = set(df.columns)
+    available_scores = [(col, name) for col, name in cross_norm_scores if col in df_columns]
     print(f"  Available scores for cross-norm: {len(available_scores)}/6")
 
     if len(available_scores) == 6:
-        # Create filter for rows where ALL scores are defined
-        cross_norm_filter = pl.lit(True)
-        for col, _ in available_scores:
-            cross_norm_filter = cross_norm_filter & pl.col(col).is_not_null()
+        # Filter for rows where ALL scores are defined: one horizontal
+        # reduction instead of a chain of six And kernels
+        cross_norm_filter = pl.all_horizontal(
+            [pl.col(col).is_not_null() for col, _ in available_scores]
+        )
 
-        # Count cross-norm positions
-        cross_norm_count = df.filter(cross_norm_filter).height
+        # Count cross-norm positions by summing the mask rather than
+        # materializing the filtered frame just to read its height
+        cross_norm_count = df.select(cross_norm_filter.sum()).item()
         print(f"  Cross-norm positions: {cross_norm_count:,}")
 
-        # Build all cross-norm percentile expressions at once
+        # Build all cross-norm percentile expressions at once. Masking the
+        # column first and ranking the masked values (nulls rank as null)
+        # avoids rank().over(filter), which partitions by True/False and
+        # ranks the discarded rows too.
         cross_norm_exprs = []
         for col, name in available_scores:
             perc_col = f'{name}_cross_norm_perc'
+            masked = pl.when(cross_norm_filter).then(pl.col(col)).otherwise(None)
             cross_norm_exprs.append(
-                pl.when(cross_norm_filter)
-                .then(
-                    pl.col(col).rank(method='average').over(cross_norm_filter)
-                    / cross_norm_count * 100
-                )
-                .otherwise(None)
+                (masked.rank(method='average') / cross_norm_count * 100)
+                .cast(pl.Float32)
                 .alias(perc_col)
             )
 
@@ -512,21 +556,42 @@ def main(input_path: str, output_path: str):
         print(f"  Calculated {len(cross_norm_exprs)} cross-norm percentiles in parallel")
     else:
         print("  WARNING: Not all 6 scores available, skipping cross-norm percentiles")
-        missing = [name for col, name in cross_norm_scores if col not in df.columns]
+        missing = [name for col, name in cross_norm_scores if col not in df_columns]
         print(f"  Missing: {missing}")
 
+    # --- PERCENTILE CUTPOINTS SIDECAR ---
+    print(f"\n=== Writing Percentile Cutpoints ===")
+    write_cutpoints_sidecar(df, all_columns, output_path)
+
     # --- SAVE OUTPUT ---
     print(f"\n=== Saving Output ===")
     print(f"  Output: {output_path}")
     print(f"  Columns: {len(df.columns)}")
 
+    # Downcast max_pred columns last, after all ranking has run on the
+    # full-precision values, so tie handling is unaffected
+    max_pred_casts = [
+        pl.col(c).cast(pl.Float32) for c in df.columns if c.endswith('_max_pred')
+    ]
+    if max_pred_casts:
+        df = df.with_columns(max_pred_casts)
+
     # Show new percentile columns
     perc_cols = [c for c in df.columns if '_perc' in c or '_max_pred' in c]
     print(f"  New computed columns: {len(perc_cols)}")
-    for c in sorted(perc_cols):
-        print(f"    - {c}")
-
-    df.write_parquet(output_path)
+    if perc_cols:
+        print("    - " + "\n    - ".join(sorted(perc_cols)))
+
+    # zstd-3 with statistics and 64k row groups, matching the other
+    # pipeline outputs; statistics let downstream scan_parquet readers
+    # skip row groups on predicate pushdown
+    df.write_parquet(
+        output_path,
+        compression='zstd',
+        compression_level=3,
+        statistics=True,
+        row_group_size=65536,
+    )
     print(f"\nDone! Output size: {Path(output_path).stat().st_size / 1024 / 1024:.1f} MB")
 
 
@@ -534,6 +599,11 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Calculate percentiles for browser scores')
     parser.add_argument('--input', '-i', required=True, help='Input parquet file')
     parser.add_argument('--output', '-o', required=True, help='Output parquet file')
+    parser.add_argument(
+        '--percentile-method', choices=['average', 'nearest'], default='average',
+        help="Exome-wide percentile method: 'average' (tie-averaged rank) or "
+             "'nearest' (nearest-rank, cheaper; no tie averaging)"
+    )
 
     args = parser.parse_args()
-    main(args.input, args.output)
+    main(args.input, args.output, args.percentile_method)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Convert protein map parquet files to Arrow IPC (Feather v2).
+
+IPC files are written uncompressed so the backend can memory-map them at
+startup: the kernel pages in only the rows that are touched, repeated
+startups skip parquet decode entirely, and multiple Gunicorn workers
+share the same physical pages.
+
+The backend prefers a `{gene}_protein_map.arrow` file when it sits next
+to the parquet; the parquet remains the source of truth.
+
+Usage:
+    python scripts/convert_protein_maps_to_ipc.py [--data-dir DATA_DIR]
+"""
+
+import argparse
+from pathlib import Path
+
+import polars as pl
+
+# Try to import from browser config, fall back to local path
+try:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from browser.backend.config import get_data_dir
+    DATA_DIR = get_data_dir()
+except ImportError:
+    DATA_DIR = Path(__file__).parent.parent / 'data'
+
+
+def convert_protein_maps(data_dir: Path) -> int:
+    """Write an uncompressed .arrow twin for each protein map parquet."""
+    converted = 0
+    for parquet_path in sorted(data_dir.glob('*_protein_map.parquet')):
+        ipc_path = parquet_path.with_suffix('.arrow')
+        if ipc_path.exists() and ipc_path.stat().st_mtime >= parquet_path.stat().st_mtime:
+            print(f"  Up to date: {ipc_path.name}")
+            continue
+
+        df = pl.read_parquet(parquet_path)
+        df.write_ipc(ipc_path, compression='uncompressed')
+        print(f"  Wrote {ipc_path.name} ({len(df)} rows)")
+        converted += 1
+
+    return converted
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert protein maps to Arrow IPC')
+    parser.add_argument('--data-dir', type=Path, default=DATA_DIR,
+                        help='Directory containing *_protein_map.parquet files')
+    args = parser.parse_args()
+
+    print(f"Converting protein maps in {args.data_dir}...")
+    converted = convert_protein_maps(args.data_dir)
+    print(f"Done: {converted} file(s) converted")
+
+
+if __name__ == '__main__':
+    main()
@@ -308,6 +308,16 @@ def process_filter(df, filter_id, filter_config, chrom_col, pos_col, gene_col, c
     axis_table.write_parquet(output_file)
     print(f"✓ Saved: {output_file}")
     print(f"  Size: {output_file.stat().st_size / 1024 / 1024:.2f} MB")
+
+    # Narrow "hot" companion table: the browser's window/axis/gene
+    # endpoints only ever need these columns, so give the backend a file
+    # it can load without touching the wide annotation columns
+    core_cols = [c for c in ('filtered_idx', 'chrom', 'pos', 'gene_symbol')
+                 if c in axis_table.columns]
+    core_file = output_dir / f'{filter_id}_core.parquet'
+    axis_table.select(core_cols).write_parquet(core_file)
+    print(f"✓ Saved: {core_file}")
+    print(f"  Size: {core_file.stat().st_size / 1024 / 1024:.2f} MB")
     
     # Generate gene index
     print(f"\nGenerating gene index...")